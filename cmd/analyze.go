@@ -3,7 +3,6 @@ package cmd
 import (
 	"context"
 	"fmt"
-	"log/slog"
 	"os"
 	"regexp"
 	"strings"
@@ -11,7 +10,6 @@ import (
 
 	"github.com/bimmerbailey/cyro/internal/analyzer"
 	"github.com/bimmerbailey/cyro/internal/config"
-	"github.com/bimmerbailey/cyro/internal/llm"
 	"github.com/bimmerbailey/cyro/internal/output"
 	"github.com/bimmerbailey/cyro/internal/parser"
 	"github.com/bimmerbailey/cyro/internal/preprocess"
@@ -49,6 +47,9 @@ func init() {
 	rootCmd.AddCommand(analyzeCmd)
 }
 
+// validGroupFields lists the fields accepted by --group-by.
+var validGroupFields = map[string]bool{"level": true, "message": true, "source": true}
+
 func runAnalyze(cmd *cobra.Command, args []string) error {
 	aiEnabled, _ := cmd.Flags().GetBool("ai")
 	topN, _ := cmd.Flags().GetInt("top")
@@ -57,7 +58,6 @@ func runAnalyze(cmd *cobra.Command, args []string) error {
 	windowStr, _ := cmd.Flags().GetString("window")
 
 	// Validate group-by field
-	validGroupFields := map[string]bool{"level": true, "message": true, "source": true}
 	if !validGroupFields[groupBy] {
 		return fmt.Errorf("invalid --group-by value: %s (must be 'level', 'message', or 'source')", groupBy)
 	}
@@ -93,22 +93,14 @@ func runAnalyze(cmd *cobra.Command, args []string) error {
 	p := parser.New(viper.GetStringSlice("timestamp_formats"))
 	anlz := analyzer.New()
 
-	// Collect all matching entries
-	var allEntries []config.LogEntry
+	// Collect all matching entries (files are parsed concurrently)
 	multiFile := len(files) > 1
-
-	for _, file := range files {
-		err = p.ParseFileStream(file, func(entry config.LogEntry) error {
-			// Apply pattern filter
-			if re != nil && !re.MatchString(entry.Raw) {
-				return nil
-			}
-			allEntries = append(allEntries, entry)
-			return nil
-		})
-		if err != nil {
-			return err
-		}
+	allEntries, err := parseFiles(p, files, func(entry config.LogEntry) bool {
+		// Apply pattern filter
+		return re == nil || re.MatchString(entry.Raw)
+	})
+	if err != nil {
+		return err
 	}
 
 	if len(allEntries) == 0 {
@@ -228,9 +220,9 @@ func outputAnalysisText(cmd *cobra.Command, result analyzer.AnalysisResult, file
 		if len(key) > 80 {
 			key = key[:77] + "..."
 		}
-		fmt.Fprintf(cmd.OutOrStdout(), "  %2d. %-8s entries (%.1f%%) - %s\n",
+		fmt.Fprintf(cmd.OutOrStdout(), "  %2d. %-8d entries (%.1f%%) - %s\n",
 			i+1,
-			fmt.Sprintf("%d", group.Count),
+			group.Count,
 			group.Percent,
 			key)
 	}
@@ -299,32 +291,9 @@ func runAIAnalyze(
 	}
 
 	// 3. Initialize LLM provider
-	logger := slog.New(slog.NewTextHandler(os.Stderr, &slog.HandlerOptions{
-		Level: slog.LevelError,
-	}))
-	if verbose {
-		logger = slog.New(slog.NewTextHandler(os.Stderr, &slog.HandlerOptions{
-			Level: slog.LevelInfo,
-		}))
-	}
-
-	cfg := &config.Config{}
-	if err := viper.Unmarshal(cfg); err != nil {
-		return fmt.Errorf("failed to unmarshal config: %w", err)
-	}
-
-	provider, err := llm.NewProvider(cfg, logger)
+	provider, _, chatOpts, err := newLLMProvider(ctx, verbose)
 	if err != nil {
-		return fmt.Errorf("failed to create LLM provider: %w\n\nTroubleshooting:\n- Ensure Ollama is running: ollama serve\n- Check provider config in ~/.cyro.yaml\n- For cloud providers, verify API keys are set", err)
-	}
-
-	// Health check
-	if err := provider.Heartbeat(ctx); err != nil {
-		if cfg.LLM.Provider == "ollama" {
-			return fmt.Errorf("cannot connect to Ollama at %s: %w\n\nStart Ollama with: ollama serve",
-				cfg.LLM.Ollama.Host, err)
-		}
-		return fmt.Errorf("LLM provider %s unavailable: %w", cfg.LLM.Provider, err)
+		return err
 	}
 
 	// 4. Build prompts
@@ -339,21 +308,6 @@ func runAIAnalyze(
 		return fmt.Errorf("failed to build prompt: %w", err)
 	}
 
-	chatOpts := &llm.ChatOptions{
-		Temperature: float32(cfg.LLM.Temperature),
-		MaxTokens:   cfg.LLM.MaxTokens,
-	}
-
-	// Set model based on provider
-	switch cfg.LLM.Provider {
-	case "ollama":
-		chatOpts.Model = cfg.LLM.Ollama.Model
-	case "openai":
-		chatOpts.Model = cfg.LLM.OpenAI.Model
-	case "anthropic":
-		chatOpts.Model = cfg.LLM.Anthropic.Model
-	}
-
 	// 5. Stream LLM response
 	stream, err := provider.ChatStream(ctx, messages, chatOpts)
 	if err != nil {
@@ -26,13 +26,7 @@ func TestAnalyzeBasicText(t *testing.T) {
 	viper.Set("format", "text")
 
 	dir := t.TempDir()
-	file := writeTempFile(t, dir, "app.log", []string{
-		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"first"}`,
-		`{"timestamp":"2025-01-26T10:00:01Z","level":"error","message":"boom"}`,
-		`{"timestamp":"2025-01-26T10:00:02Z","level":"info","message":"second"}`,
-		`{"timestamp":"2025-01-26T10:00:03Z","level":"error","message":"boom"}`,
-		`{"timestamp":"2025-01-26T10:00:04Z","level":"warn","message":"warning"}`,
-	})
+	file := writeTempFile(t, dir, "app.log", mixedLevelLines)
 
 	var out bytes.Buffer
 	cmd := newAnalyzeTestCmd(&out)
@@ -219,10 +213,7 @@ func TestAnalyzeTable(t *testing.T) {
 	viper.Set("format", "table")
 
 	dir := t.TempDir()
-	file := writeTempFile(t, dir, "app.log", []string{
-		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"first"}`,
-		`{"timestamp":"2025-01-26T10:00:01Z","level":"error","message":"boom"}`,
-	})
+	file := writeTempFile(t, dir, "app.log", twoEntryLines)
 
 	var out bytes.Buffer
 	cmd := newAnalyzeTestCmd(&out)
@@ -274,7 +265,7 @@ func TestAnalyzeEmptyFile(t *testing.T) {
 	}
 }
 
-func TestAnalyzeInvalidGroupBy(t *testing.T) {
+func TestAnalyzeInvalidFlags(t *testing.T) {
 	viper.Reset()
 	viper.Set("format", "text")
 
@@ -283,69 +274,34 @@ func TestAnalyzeInvalidGroupBy(t *testing.T) {
 		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"first"}`,
 	})
 
-	var out bytes.Buffer
-	cmd := newAnalyzeTestCmd(&out)
-	if err := cmd.Flags().Set("group-by", "invalid"); err != nil {
-		t.Fatalf("Set() error = %v", err)
-	}
-
-	err := runAnalyze(cmd, []string{file})
-	if err == nil {
-		t.Fatal("expected error for invalid group-by, got nil")
-	}
-
-	if !strings.Contains(err.Error(), "invalid --group-by value") {
-		t.Errorf("expected error about invalid group-by, got: %v", err)
-	}
-}
-
-func TestAnalyzeInvalidPattern(t *testing.T) {
-	viper.Reset()
-	viper.Set("format", "text")
-
-	dir := t.TempDir()
-	file := writeTempFile(t, dir, "app.log", []string{
-		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"first"}`,
-	})
-
-	var out bytes.Buffer
-	cmd := newAnalyzeTestCmd(&out)
-	if err := cmd.Flags().Set("pattern", "[invalid("); err != nil {
-		t.Fatalf("Set() error = %v", err)
-	}
-
-	err := runAnalyze(cmd, []string{file})
-	if err == nil {
-		t.Fatal("expected error for invalid pattern, got nil")
-	}
-
-	if !strings.Contains(err.Error(), "invalid pattern") {
-		t.Errorf("expected error about invalid pattern, got: %v", err)
-	}
-}
-
-func TestAnalyzeInvalidWindow(t *testing.T) {
-	viper.Reset()
-	viper.Set("format", "text")
-
-	dir := t.TempDir()
-	file := writeTempFile(t, dir, "app.log", []string{
-		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"first"}`,
-	})
-
-	var out bytes.Buffer
-	cmd := newAnalyzeTestCmd(&out)
-	if err := cmd.Flags().Set("window", "invalid"); err != nil {
-		t.Fatalf("Set() error = %v", err)
-	}
-
-	err := runAnalyze(cmd, []string{file})
-	if err == nil {
-		t.Fatal("expected error for invalid window, got nil")
-	}
-
-	if !strings.Contains(err.Error(), "invalid --window value") {
-		t.Errorf("expected error about invalid window, got: %v", err)
+	tests := []struct {
+		name    string
+		flag    string
+		value   string
+		wantErr string
+	}{
+		{"invalid group-by", "group-by", "invalid", "invalid --group-by value"},
+		{"invalid pattern", "pattern", "[invalid(", "invalid pattern"},
+		{"invalid window", "window", "invalid", "invalid --window value"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var out bytes.Buffer
+			cmd := newAnalyzeTestCmd(&out)
+			if err := cmd.Flags().Set(tt.flag, tt.value); err != nil {
+				t.Fatalf("Set() error = %v", err)
+			}
+
+			err := runAnalyze(cmd, []string{file})
+			if err == nil {
+				t.Fatalf("expected error for %s, got nil", tt.name)
+			}
+
+			if !strings.Contains(err.Error(), tt.wantErr) {
+				t.Errorf("expected error containing %q, got: %v", tt.wantErr, err)
+			}
+		})
 	}
 }
 
@@ -354,13 +310,7 @@ func TestAnalyzeTopN(t *testing.T) {
 	viper.Set("format", "json")
 
 	dir := t.TempDir()
-	file := writeTempFile(t, dir, "app.log", []string{
-		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"unique1"}`,
-		`{"timestamp":"2025-01-26T10:00:01Z","level":"info","message":"common"}`,
-		`{"timestamp":"2025-01-26T10:00:02Z","level":"info","message":"unique2"}`,
-		`{"timestamp":"2025-01-26T10:00:03Z","level":"info","message":"common"}`,
-		`{"timestamp":"2025-01-26T10:00:04Z","level":"info","message":"unique3"}`,
-	})
+	file := writeTempFile(t, dir, "app.log", repeatedMessageLines)
 
 	var out bytes.Buffer
 	cmd := newAnalyzeTestCmd(&out)
@@ -3,14 +3,12 @@ package cmd
 import (
 	"context"
 	"fmt"
-	"log/slog"
 	"os"
 	"regexp"
 	"strings"
 	"time"
 
 	"github.com/bimmerbailey/cyro/internal/config"
-	"github.com/bimmerbailey/cyro/internal/llm"
 	"github.com/bimmerbailey/cyro/internal/output"
 	"github.com/bimmerbailey/cyro/internal/parser"
 	"github.com/bimmerbailey/cyro/internal/preprocess"
@@ -156,32 +154,9 @@ func runAsk(cmd *cobra.Command, args []string) error {
 	}
 
 	// Initialize LLM provider
-	logger := slog.New(slog.NewTextHandler(os.Stderr, &slog.HandlerOptions{
-		Level: slog.LevelError,
-	}))
-	if verbose {
-		logger = slog.New(slog.NewTextHandler(os.Stderr, &slog.HandlerOptions{
-			Level: slog.LevelInfo,
-		}))
-	}
-
-	cfg := &config.Config{}
-	if err := viper.Unmarshal(cfg); err != nil {
-		return fmt.Errorf("failed to unmarshal config: %w", err)
-	}
-
-	provider, err := llm.NewProvider(cfg, logger)
+	provider, providerName, chatOpts, err := newLLMProvider(ctx, verbose)
 	if err != nil {
-		return fmt.Errorf("failed to create LLM provider: %w\n\nTroubleshooting:\n- Ensure Ollama is running: ollama serve\n- Check provider config in ~/.cyro.yaml\n- For cloud providers, verify API keys are set", err)
-	}
-
-	// Health check
-	if err := provider.Heartbeat(ctx); err != nil {
-		if cfg.LLM.Provider == "ollama" {
-			return fmt.Errorf("cannot connect to Ollama at %s: %w\n\nStart Ollama with: ollama serve",
-				cfg.LLM.Ollama.Host, err)
-		}
-		return fmt.Errorf("LLM provider %s unavailable: %w", cfg.LLM.Provider, err)
+		return err
 	}
 
 	// Build prompts
@@ -196,21 +171,6 @@ func runAsk(cmd *cobra.Command, args []string) error {
 		return fmt.Errorf("failed to build prompt: %w", err)
 	}
 
-	chatOpts := &llm.ChatOptions{
-		Temperature: float32(cfg.LLM.Temperature),
-		MaxTokens:   cfg.LLM.MaxTokens,
-	}
-
-	// Set model based on provider
-	switch cfg.LLM.Provider {
-	case "ollama":
-		chatOpts.Model = cfg.LLM.Ollama.Model
-	case "openai":
-		chatOpts.Model = cfg.LLM.OpenAI.Model
-	case "anthropic":
-		chatOpts.Model = cfg.LLM.Anthropic.Model
-	}
-
 	// Stream LLM response
 	stream, err := provider.ChatStream(ctx, messages, chatOpts)
 	if err != nil {
@@ -262,7 +222,7 @@ func runAsk(cmd *cobra.Command, args []string) error {
 			},
 			"answer": fullResponse.String(),
 			"metadata": map[string]interface{}{
-				"provider": cfg.LLM.Provider,
+				"provider": providerName,
 				"model":    chatOpts.Model,
 				"filters": map[string]string{
 					"pattern": pattern,
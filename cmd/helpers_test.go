@@ -0,0 +1,52 @@
+package cmd
+
+import (
+	"bytes"
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+func writeTempFile(t *testing.T, dir string, name string, lines []string) string {
+	path := filepath.Join(dir, name)
+	content := []byte("" + joinLines(lines))
+	if err := os.WriteFile(path, content, 0o600); err != nil {
+		t.Fatalf("WriteFile() error = %v", err)
+	}
+	return path
+}
+
+func joinLines(lines []string) string {
+	buf := bytes.Buffer{}
+	for i, line := range lines {
+		buf.WriteString(line)
+		if i < len(lines)-1 {
+			buf.WriteString("\n")
+		}
+	}
+	return buf.String()
+}
+
+// Log fixtures shared by the analyze and stats command tests.
+var (
+	mixedLevelLines = []string{
+		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"first"}`,
+		`{"timestamp":"2025-01-26T10:00:01Z","level":"error","message":"boom"}`,
+		`{"timestamp":"2025-01-26T10:00:02Z","level":"info","message":"second"}`,
+		`{"timestamp":"2025-01-26T10:00:03Z","level":"error","message":"boom"}`,
+		`{"timestamp":"2025-01-26T10:00:04Z","level":"warn","message":"warning"}`,
+	}
+
+	twoEntryLines = []string{
+		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"first"}`,
+		`{"timestamp":"2025-01-26T10:00:01Z","level":"error","message":"boom"}`,
+	}
+
+	repeatedMessageLines = []string{
+		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"unique1"}`,
+		`{"timestamp":"2025-01-26T10:00:01Z","level":"info","message":"common"}`,
+		`{"timestamp":"2025-01-26T10:00:02Z","level":"info","message":"unique2"}`,
+		`{"timestamp":"2025-01-26T10:00:03Z","level":"info","message":"common"}`,
+		`{"timestamp":"2025-01-26T10:00:04Z","level":"info","message":"unique3"}`,
+	}
+)
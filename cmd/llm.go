@@ -0,0 +1,62 @@
+package cmd
+
+import (
+	"context"
+	"fmt"
+	"log/slog"
+	"os"
+
+	"github.com/bimmerbailey/cyro/internal/config"
+	"github.com/bimmerbailey/cyro/internal/llm"
+	"github.com/spf13/viper"
+)
+
+// newLLMProvider loads the LLM configuration, creates the configured provider,
+// and verifies it is reachable. It also returns the configured provider name
+// and chat options with the model for that provider. Shared by `ask` and
+// `analyze --ai`.
+func newLLMProvider(ctx context.Context, verbose bool) (llm.Provider, string, *llm.ChatOptions, error) {
+	level := slog.LevelError
+	if verbose {
+		level = slog.LevelInfo
+	}
+	logger := slog.New(slog.NewTextHandler(os.Stderr, &slog.HandlerOptions{
+		Level: level,
+	}))
+
+	cfg := &config.Config{}
+	if err := viper.Unmarshal(cfg); err != nil {
+		return nil, "", nil, fmt.Errorf("failed to unmarshal config: %w", err)
+	}
+
+	provider, err := llm.NewProvider(cfg, logger)
+	if err != nil {
+		return nil, "", nil, fmt.Errorf("failed to create LLM provider: %w\n\nTroubleshooting:\n- Ensure Ollama is running: ollama serve\n- Check provider config in ~/.cyro.yaml\n- For cloud providers, verify API keys are set", err)
+	}
+
+	// Health check
+	if err := provider.Heartbeat(ctx); err != nil {
+		if cfg.LLM.Provider == "ollama" {
+			return nil, "", nil, fmt.Errorf("cannot connect to Ollama at %s: %w\n\nStart Ollama with: ollama serve",
+				cfg.LLM.Ollama.Host, err)
+		}
+		return nil, "", nil, fmt.Errorf("LLM provider %s unavailable: %w", cfg.LLM.Provider, err)
+	}
+
+	chatOpts := &llm.ChatOptions{
+		Temperature: float32(cfg.LLM.Temperature),
+		MaxTokens:   cfg.LLM.MaxTokens,
+	}
+
+	// Set model based on provider
+	switch cfg.LLM.Provider {
+	case "ollama":
+		chatOpts.Model = cfg.LLM.Ollama.Model
+	case "openai":
+		chatOpts.Model = cfg.LLM.OpenAI.Model
+	case "anthropic":
+		chatOpts.Model = cfg.LLM.Anthropic.Model
+	}
+
+	return provider, cfg.LLM.Provider, chatOpts, nil
+}
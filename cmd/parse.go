@@ -0,0 +1,57 @@
+package cmd
+
+import (
+	"runtime"
+	"sync"
+
+	"github.com/bimmerbailey/cyro/internal/config"
+	"github.com/bimmerbailey/cyro/internal/parser"
+)
+
+// parseFiles parses files concurrently and returns the entries accepted by
+// keep, preserving file order and line order within each file. keep may be
+// called from multiple goroutines and must not mutate shared state.
+func parseFiles(p *parser.Parser, files []string, keep func(config.LogEntry) bool) ([]config.LogEntry, error) {
+	results := make([][]config.LogEntry, len(files))
+	errs := make([]error, len(files))
+
+	parseOne := func(i int) {
+		errs[i] = p.ParseFileStream(files[i], func(entry config.LogEntry) error {
+			if keep(entry) {
+				results[i] = append(results[i], entry)
+			}
+			return nil
+		})
+	}
+
+	if len(files) == 1 {
+		parseOne(0)
+	} else {
+		sem := make(chan struct{}, runtime.GOMAXPROCS(0))
+		var wg sync.WaitGroup
+		for i := range files {
+			wg.Add(1)
+			go func(i int) {
+				defer wg.Done()
+				sem <- struct{}{}
+				defer func() { <-sem }()
+				parseOne(i)
+			}(i)
+		}
+		wg.Wait()
+	}
+
+	total := 0
+	for i, err := range errs {
+		if err != nil {
+			return nil, err
+		}
+		total += len(results[i])
+	}
+
+	entries := make([]config.LogEntry, 0, total)
+	for _, r := range results {
+		entries = append(entries, r...)
+	}
+	return entries, nil
+}
@@ -0,0 +1,75 @@
+package cmd
+
+import (
+	"errors"
+	"io/fs"
+	"path/filepath"
+	"reflect"
+	"testing"
+
+	"github.com/bimmerbailey/cyro/internal/config"
+	"github.com/bimmerbailey/cyro/internal/parser"
+)
+
+func TestParseFilesPreservesOrder(t *testing.T) {
+	dir := t.TempDir()
+	files := []string{
+		writeTempFile(t, dir, "a.log", []string{
+			"2025-01-26 10:00:00 INFO a1",
+			"2025-01-26 10:00:01 ERROR a2",
+			"2025-01-26 10:00:02 WARN a3",
+		}),
+		writeTempFile(t, dir, "b.log", []string{
+			"2025-01-26 09:00:00 ERROR b1",
+			"2025-01-26 09:00:01 INFO b2",
+		}),
+		writeTempFile(t, dir, "c.log", []string{
+			"2025-01-26 08:00:00 INFO c1",
+		}),
+		writeTempFile(t, dir, "d.log", []string{
+			"2025-01-26 07:00:00 WARN d1",
+			"2025-01-26 07:00:01 FATAL d2",
+			"2025-01-26 07:00:02 ERROR d3",
+		}),
+	}
+
+	keep := func(e config.LogEntry) bool { return e.Level != config.LevelInfo }
+
+	entries, err := parseFiles(parser.New(nil), files, keep)
+	if err != nil {
+		t.Fatalf("parseFiles() error = %v", err)
+	}
+
+	var got []string
+	for _, e := range entries {
+		got = append(got, e.Raw)
+	}
+	want := []string{
+		"2025-01-26 10:00:01 ERROR a2",
+		"2025-01-26 10:00:02 WARN a3",
+		"2025-01-26 09:00:00 ERROR b1",
+		"2025-01-26 07:00:00 WARN d1",
+		"2025-01-26 07:00:01 FATAL d2",
+		"2025-01-26 07:00:02 ERROR d3",
+	}
+	if !reflect.DeepEqual(got, want) {
+		t.Errorf("parseFiles() entries =\n%q\nwant\n%q", got, want)
+	}
+}
+
+func TestParseFilesMissingFile(t *testing.T) {
+	dir := t.TempDir()
+	files := []string{
+		writeTempFile(t, dir, "a.log", []string{"2025-01-26 10:00:00 ERROR a1"}),
+		filepath.Join(dir, "missing.log"),
+		writeTempFile(t, dir, "c.log", []string{"2025-01-26 10:00:00 ERROR c1"}),
+	}
+
+	entries, err := parseFiles(parser.New(nil), files, func(config.LogEntry) bool { return true })
+	if !errors.Is(err, fs.ErrNotExist) {
+		t.Fatalf("parseFiles() error = %v, want fs.ErrNotExist", err)
+	}
+	if entries != nil {
+		t.Errorf("parseFiles() entries = %v, want nil on error", entries)
+	}
+}
@@ -1,6 +1,7 @@
 package cmd
 
 import (
+	"bufio"
 	"fmt"
 	"regexp"
 	"time"
@@ -96,36 +97,24 @@ func runSearch(cmd *cobra.Command, args []string) error {
 	p := parser.New(viper.GetStringSlice("timestamp_formats"))
 	multiFile := len(files) > 1
 
-	if countOnly {
-		return runSearchCount(cmd, p, files, searchFilterOptions{
-			re:          re,
-			invert:      invert,
-			level:       levelFilter,
-			since:       since,
-			until:       until,
-			levelActive: levelStr != "",
-		}, multiFile)
-	}
-
-	if format == output.FormatJSON {
-		return runSearchJSON(cmd, p, files, searchFilterOptions{
-			re:          re,
-			invert:      invert,
-			level:       levelFilter,
-			since:       since,
-			until:       until,
-			levelActive: levelStr != "",
-		}, contextLines)
-	}
-
-	return runSearchTextOrTable(cmd, p, files, searchFilterOptions{
+	opts := &searchFilterOptions{
 		re:          re,
 		invert:      invert,
 		level:       levelFilter,
 		since:       since,
 		until:       until,
 		levelActive: levelStr != "",
-	}, format, contextLines, multiFile)
+	}
+
+	if countOnly {
+		return runSearchCount(cmd, p, files, opts, multiFile)
+	}
+
+	if format == output.FormatJSON {
+		return runSearchJSON(cmd, p, files, opts, contextLines)
+	}
+
+	return runSearchTextOrTable(cmd, p, files, opts, format, contextLines, multiFile)
 }
 
 type searchFilterOptions struct {
@@ -137,7 +126,7 @@ type searchFilterOptions struct {
 	levelActive bool
 }
 
-func (opts searchFilterOptions) matches(entry config.LogEntry) bool {
+func (opts *searchFilterOptions) matches(entry config.LogEntry) bool {
 	if opts.levelActive && entry.Level != opts.level {
 		return false
 	}
@@ -172,7 +161,8 @@ type contextEmitter struct {
 	afterRemaining  int
 	inContext       bool
 	hasOutput       bool
-	before          []config.LogEntry
+	before          []config.LogEntry // Ring buffer of the last `context` entries
+	beforeStart     int               // Index of the oldest entry in before
 }
 
 func (c *contextEmitter) process(entry config.LogEntry) error {
@@ -195,7 +185,8 @@ func (c *contextEmitter) process(entry config.LogEntry) error {
 			}
 		}
 
-		for _, prev := range c.before {
+		for i := range c.before {
+			prev := c.before[(c.beforeStart+i)%len(c.before)]
 			if prev.Line <= c.lastEmittedLine {
 				continue
 			}
@@ -231,16 +222,18 @@ func (c *contextEmitter) process(entry config.LogEntry) error {
 	}
 
 	if c.context > 0 {
-		c.before = append(c.before, entry)
-		if len(c.before) > c.context {
-			c.before = c.before[1:]
+		if len(c.before) < c.context {
+			c.before = append(c.before, entry)
+		} else {
+			c.before[c.beforeStart] = entry
+			c.beforeStart = (c.beforeStart + 1) % c.context
 		}
 	}
 
 	return nil
 }
 
-func runSearchCount(cmd *cobra.Command, p *parser.Parser, files []string, opts searchFilterOptions, multiFile bool) error {
+func runSearchCount(cmd *cobra.Command, p *parser.Parser, files []string, opts *searchFilterOptions, multiFile bool) error {
 	for _, filePath := range files {
 		count := 0
 		err := p.ParseFileStream(filePath, func(entry config.LogEntry) error {
@@ -261,7 +254,7 @@ func runSearchCount(cmd *cobra.Command, p *parser.Parser, files []string, opts s
 	return nil
 }
 
-func runSearchJSON(cmd *cobra.Command, p *parser.Parser, files []string, opts searchFilterOptions, contextLines int) error {
+func runSearchJSON(cmd *cobra.Command, p *parser.Parser, files []string, opts *searchFilterOptions, contextLines int) error {
 	writer := output.New(cmd.OutOrStdout(), output.FormatJSON)
 
 	if len(files) == 1 {
@@ -284,7 +277,7 @@ func runSearchJSON(cmd *cobra.Command, p *parser.Parser, files []string, opts se
 	return writer.WriteJSON(result)
 }
 
-func runSearchTextOrTable(cmd *cobra.Command, p *parser.Parser, files []string, opts searchFilterOptions, format output.Format, contextLines int, multiFile bool) error {
+func runSearchTextOrTable(cmd *cobra.Command, p *parser.Parser, files []string, opts *searchFilterOptions, format output.Format, contextLines int, multiFile bool) error {
 	if format == output.FormatTable {
 		writer := output.New(cmd.OutOrStdout(), output.FormatTable)
 		for _, filePath := range files {
@@ -302,24 +295,27 @@ func runSearchTextOrTable(cmd *cobra.Command, p *parser.Parser, files []string,
 		return nil
 	}
 
-	prefix := func(filePath string, line string) string {
-		if !multiFile {
-			return line
-		}
-		return fmt.Sprintf("%s:%s", filePath, line)
-	}
+	// Buffer matches so each line is not its own write to stdout. Flush
+	// before returning an error so matches found so far are still shown.
+	// The writer keeps its first write error, so WriteByte and Flush
+	// report a failure from any earlier write.
+	out := bufio.NewWriter(cmd.OutOrStdout())
 
 	for _, filePath := range files {
 		emitter := &contextEmitter{
 			context: contextLines,
 			matchFn: opts.matches,
 			emit: func(entry config.LogEntry) error {
-				fmt.Fprintln(cmd.OutOrStdout(), prefix(filePath, entry.Raw))
-				return nil
+				if multiFile {
+					_, _ = out.WriteString(filePath)
+					_ = out.WriteByte(':')
+				}
+				_, _ = out.WriteString(entry.Raw)
+				return out.WriteByte('\n')
 			},
 			emitSeparator: func() error {
-				fmt.Fprintln(cmd.OutOrStdout(), "--")
-				return nil
+				_, err := out.WriteString("--\n")
+				return err
 			},
 		}
 
@@ -327,14 +323,16 @@ func runSearchTextOrTable(cmd *cobra.Command, p *parser.Parser, files []string,
 			return emitter.process(entry)
 		})
 		if err != nil {
+			// Report the parse error; a flush failure here is secondary.
+			_ = out.Flush()
 			return err
 		}
 	}
 
-	return nil
+	return out.Flush()
 }
 
-func collectEntries(p *parser.Parser, filePath string, opts searchFilterOptions, contextLines int) ([]config.LogEntry, error) {
+func collectEntries(p *parser.Parser, filePath string, opts *searchFilterOptions, contextLines int) ([]config.LogEntry, error) {
 	var entries []config.LogEntry
 
 	emitter := &contextEmitter{
@@ -2,7 +2,6 @@ package cmd
 
 import (
 	"bytes"
-	"os"
 	"path/filepath"
 	"testing"
 
@@ -23,26 +22,6 @@ func newSearchTestCmd(out *bytes.Buffer) *cobra.Command {
 	return cmd
 }
 
-func writeTempFile(t *testing.T, dir string, name string, lines []string) string {
-	path := filepath.Join(dir, name)
-	content := []byte("" + joinLines(lines))
-	if err := os.WriteFile(path, content, 0o600); err != nil {
-		t.Fatalf("WriteFile() error = %v", err)
-	}
-	return path
-}
-
-func joinLines(lines []string) string {
-	buf := bytes.Buffer{}
-	for i, line := range lines {
-		buf.WriteString(line)
-		if i < len(lines)-1 {
-			buf.WriteString("\n")
-		}
-	}
-	return buf.String()
-}
-
 func TestSearchContext(t *testing.T) {
 	viper.Reset()
 	viper.Set("format", "text")
@@ -59,7 +59,7 @@ func runStats(cmd *cobra.Command, args []string) error {
 
 	p := parser.New(viper.GetStringSlice("timestamp_formats"))
 
-	var entries []config.LogEntry
+	acc := analyzer.NewStatsAccumulator()
 	err = p.ParseFileStream(filePath, func(entry config.LogEntry) error {
 		if !since.IsZero() && !entry.Timestamp.IsZero() && entry.Timestamp.Before(since) {
 			return nil
@@ -67,15 +67,14 @@ func runStats(cmd *cobra.Command, args []string) error {
 		if !until.IsZero() && !entry.Timestamp.IsZero() && entry.Timestamp.After(until) {
 			return nil
 		}
-		entries = append(entries, entry)
+		acc.Add(entry)
 		return nil
 	})
 	if err != nil {
 		return err
 	}
 
-	anlz := analyzer.New()
-	stats := anlz.ComputeStats(entries, topN)
+	stats := acc.Stats(topN)
 
 	format := output.ParseFormat(viper.GetString("format"))
 
@@ -89,6 +88,17 @@ func runStats(cmd *cobra.Command, args []string) error {
 	}
 }
 
+// statsLevelOrder is the order levels are listed in stats output, most
+// severe first.
+var statsLevelOrder = []config.LogLevel{
+	config.LevelFatal,
+	config.LevelError,
+	config.LevelWarn,
+	config.LevelInfo,
+	config.LevelDebug,
+	config.LevelUnknown,
+}
+
 func outputStatsJSON(cmd *cobra.Command, stats analyzer.Stats) error {
 	writer := output.New(cmd.OutOrStdout(), output.FormatJSON)
 	return writer.WriteJSON(stats)
@@ -100,15 +110,7 @@ func outputStatsTable(cmd *cobra.Command, stats analyzer.Stats) error {
 	fmt.Fprintln(cmd.OutOrStdout(), "Level Distribution:")
 	fmt.Fprintln(cmd.OutOrStdout(), "LEVEL\tCOUNT\tPERCENTAGE")
 	fmt.Fprintln(cmd.OutOrStdout(), "-----\t-----\t----------")
-	levels := []config.LogLevel{
-		config.LevelFatal,
-		config.LevelError,
-		config.LevelWarn,
-		config.LevelInfo,
-		config.LevelDebug,
-		config.LevelUnknown,
-	}
-	for _, level := range levels {
+	for _, level := range statsLevelOrder {
 		count := stats.LevelCounts[level]
 		if count > 0 {
 			percent := float64(count) * 100 / float64(stats.TotalLines)
@@ -144,15 +146,7 @@ func outputStatsText(cmd *cobra.Command, filePath string, stats analyzer.Stats)
 	fmt.Fprintf(cmd.OutOrStdout(), "  Total Lines: %d\n", stats.TotalLines)
 
 	fmt.Fprintln(cmd.OutOrStdout(), "\n  Level Distribution:")
-	levels := []config.LogLevel{
-		config.LevelFatal,
-		config.LevelError,
-		config.LevelWarn,
-		config.LevelInfo,
-		config.LevelDebug,
-		config.LevelUnknown,
-	}
-	for _, level := range levels {
+	for _, level := range statsLevelOrder {
 		count := stats.LevelCounts[level]
 		if count > 0 {
 			percent := float64(count) * 100 / float64(stats.TotalLines)
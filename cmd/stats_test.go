@@ -25,13 +25,7 @@ func TestStatsBasicText(t *testing.T) {
 	viper.Set("format", "text")
 
 	dir := t.TempDir()
-	file := writeTempFile(t, dir, "app.log", []string{
-		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"first"}`,
-		`{"timestamp":"2025-01-26T10:00:01Z","level":"error","message":"boom"}`,
-		`{"timestamp":"2025-01-26T10:00:02Z","level":"info","message":"second"}`,
-		`{"timestamp":"2025-01-26T10:00:03Z","level":"error","message":"boom"}`,
-		`{"timestamp":"2025-01-26T10:00:04Z","level":"warn","message":"warning"}`,
-	})
+	file := writeTempFile(t, dir, "app.log", mixedLevelLines)
 
 	var out bytes.Buffer
 	cmd := newStatsTestCmd(&out)
@@ -96,10 +90,7 @@ func TestStatsTable(t *testing.T) {
 	viper.Set("format", "table")
 
 	dir := t.TempDir()
-	file := writeTempFile(t, dir, "app.log", []string{
-		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"first"}`,
-		`{"timestamp":"2025-01-26T10:00:01Z","level":"error","message":"boom"}`,
-	})
+	file := writeTempFile(t, dir, "app.log", twoEntryLines)
 
 	var out bytes.Buffer
 	cmd := newStatsTestCmd(&out)
@@ -164,13 +155,7 @@ func TestStatsTopN(t *testing.T) {
 	viper.Set("format", "json")
 
 	dir := t.TempDir()
-	file := writeTempFile(t, dir, "app.log", []string{
-		`{"timestamp":"2025-01-26T10:00:00Z","level":"info","message":"unique1"}`,
-		`{"timestamp":"2025-01-26T10:00:01Z","level":"info","message":"common"}`,
-		`{"timestamp":"2025-01-26T10:00:02Z","level":"info","message":"unique2"}`,
-		`{"timestamp":"2025-01-26T10:00:03Z","level":"info","message":"common"}`,
-		`{"timestamp":"2025-01-26T10:00:04Z","level":"info","message":"unique3"}`,
-	})
+	file := writeTempFile(t, dir, "app.log", repeatedMessageLines)
 
 	var out bytes.Buffer
 	cmd := newStatsTestCmd(&out)
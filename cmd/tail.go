@@ -2,6 +2,7 @@ package cmd
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"os"
 	"os/signal"
@@ -35,6 +36,7 @@ func init() {
 	tailCmd.Flags().IntP("lines", "n", 10, "number of initial lines to show")
 	tailCmd.Flags().Bool("no-follow", false, "print last N lines and exit (don't follow)")
 	tailCmd.Flags().Bool("follow-rotate", false, "follow through log rotations (continue when file is renamed/removed)")
+	tailCmd.Flags().Duration("rotate-timeout", tail.DefaultRotateTimeout, "how long to wait for a rotated file to reappear (with --follow-rotate)")
 	tailCmd.Flags().Bool("no-color", false, "disable colored output")
 
 	rootCmd.AddCommand(tailCmd)
@@ -46,6 +48,7 @@ func runTail(cmd *cobra.Command, args []string) error {
 	lines, _ := cmd.Flags().GetInt("lines")
 	noFollow, _ := cmd.Flags().GetBool("no-follow")
 	followRotate, _ := cmd.Flags().GetBool("follow-rotate")
+	rotateTimeout, _ := cmd.Flags().GetDuration("rotate-timeout")
 	noColor, _ := cmd.Flags().GetBool("no-color")
 	patternStr, _ := cmd.Flags().GetString("pattern")
 
@@ -73,26 +76,29 @@ func runTail(cmd *cobra.Command, args []string) error {
 		}
 	}
 
-	// Determine color mode
+	// Determine color mode, checking for a terminal once rather than per line
 	colorMode := output.ColorAuto
 	if noColor {
 		colorMode = output.ColorNever
 	}
+	colorMode = output.ResolveColorMode(colorMode, os.Stdout)
 
 	// Create output function
+	out := output.New(os.Stdout, output.FormatText)
 	outputFunc := func(entry config.LogEntry) error {
-		return output.New(os.Stdout, output.FormatText).WriteColoredEntry(entry, colorMode)
+		return out.WriteColoredEntry(entry, colorMode)
 	}
 
 	// Create tailer
 	tailer := tail.New(tail.Options{
-		FilePath:     filePath,
-		Lines:        lines,
-		Follow:       !noFollow,
-		FollowRotate: followRotate,
-		Pattern:      pattern,
-		LevelFilter:  levelFilter,
-		OutputFunc:   outputFunc,
+		FilePath:      filePath,
+		Lines:         lines,
+		Follow:        !noFollow,
+		FollowRotate:  followRotate,
+		RotateTimeout: rotateTimeout,
+		Pattern:       pattern,
+		LevelFilter:   levelFilter,
+		OutputFunc:    outputFunc,
 	})
 
 	// Set up context with signal handling
@@ -119,7 +125,7 @@ func runTail(cmd *cobra.Command, args []string) error {
 		return nil
 	case err := <-errChan:
 		// Tailer finished (or errored)
-		if err != nil && err.Error() != "file rotated" {
+		if err != nil && !errors.Is(err, tail.ErrFileRotated) {
 			return err
 		}
 		return nil
@@ -5,7 +5,6 @@ package analyzer
 import (
 	"fmt"
 	"regexp"
-	"sort"
 	"time"
 
 	"github.com/bimmerbailey/cyro/internal/config"
@@ -65,40 +64,66 @@ func New() *Analyzer {
 
 // ComputeStats calculates aggregate statistics from a set of log entries.
 func (a *Analyzer) ComputeStats(entries []config.LogEntry, topN int) Stats {
-	stats := Stats{
-		TotalLines:  len(entries),
-		LevelCounts: make(map[config.LogLevel]int),
+	acc := NewStatsAccumulator()
+	for _, e := range entries {
+		acc.Add(e)
 	}
+	return acc.Stats(topN)
+}
 
-	if len(entries) == 0 {
-		return stats
-	}
+// StatsAccumulator computes the same statistics as ComputeStats one entry at
+// a time, so callers can stream entries without holding them all in memory.
+type StatsAccumulator struct {
+	stats         Stats
+	messageCounts map[string]int
+}
 
-	messageCounts := make(map[string]int)
+// NewStatsAccumulator creates an empty StatsAccumulator.
+func NewStatsAccumulator() *StatsAccumulator {
+	return &StatsAccumulator{
+		stats: Stats{
+			LevelCounts: make(map[config.LogLevel]int),
+		},
+		messageCounts: make(map[string]int),
+	}
+}
 
-	for _, e := range entries {
-		stats.LevelCounts[e.Level]++
+// Add records a single log entry.
+func (s *StatsAccumulator) Add(e config.LogEntry) {
+	s.stats.TotalLines++
+	s.stats.LevelCounts[e.Level]++
 
-		if !e.Timestamp.IsZero() {
-			if stats.FirstEntry.IsZero() || e.Timestamp.Before(stats.FirstEntry) {
-				stats.FirstEntry = e.Timestamp
-			}
-			if stats.LastEntry.IsZero() || e.Timestamp.After(stats.LastEntry) {
-				stats.LastEntry = e.Timestamp
-			}
+	if !e.Timestamp.IsZero() {
+		if s.stats.FirstEntry.IsZero() || e.Timestamp.Before(s.stats.FirstEntry) {
+			s.stats.FirstEntry = e.Timestamp
+		}
+		if s.stats.LastEntry.IsZero() || e.Timestamp.After(s.stats.LastEntry) {
+			s.stats.LastEntry = e.Timestamp
 		}
+	}
 
-		messageCounts[e.Message]++
+	s.messageCounts[e.Message]++
+}
+
+// Stats returns the statistics for all entries added so far, including the
+// topN most frequent messages. The result does not change if more entries
+// are added afterwards.
+func (s *StatsAccumulator) Stats(topN int) Stats {
+	stats := s.stats
+	stats.LevelCounts = make(map[config.LogLevel]int, len(s.stats.LevelCounts))
+	for level, n := range s.stats.LevelCounts {
+		stats.LevelCounts[level] = n
+	}
+	if stats.TotalLines == 0 {
+		return stats
 	}
 
 	// Calculate error rate
 	errorCount := stats.LevelCounts[config.LevelError] + stats.LevelCounts[config.LevelFatal]
-	if stats.TotalLines > 0 {
-		stats.ErrorRate = float64(errorCount) / float64(stats.TotalLines)
-	}
+	stats.ErrorRate = float64(errorCount) / float64(stats.TotalLines)
 
 	// Get top messages
-	stats.TopMessages = topMessages(messageCounts, topN)
+	stats.TopMessages = topMessages(s.messageCounts, topN)
 
 	return stats
 }
@@ -159,19 +184,11 @@ type FilterOptions struct {
 
 // topMessages extracts the N most frequent messages.
 func topMessages(counts map[string]int, n int) []MessageCount {
-	msgs := make([]MessageCount, 0, len(counts))
-	for msg, count := range counts {
-		msgs = append(msgs, MessageCount{Message: msg, Count: count})
-	}
-
-	sort.Slice(msgs, func(i, j int) bool {
-		return msgs[i].Count > msgs[j].Count
-	})
-
-	if len(msgs) > n {
-		msgs = msgs[:n]
+	top := topCounts(counts, n)
+	msgs := make([]MessageCount, len(top))
+	for i, kc := range top {
+		msgs[i] = MessageCount{Message: kc.key, Count: kc.count}
 	}
-
 	return msgs
 }
 
@@ -204,25 +221,16 @@ func (a *Analyzer) GroupBy(entries []config.LogEntry, field string, topN int) ([
 		groups[key]++
 	}
 
-	// Convert to slice and sort
-	result := make([]GroupedResult, 0, len(groups))
+	// Select the top N groups by count descending
+	top := topCounts(groups, topN)
+	result := make([]GroupedResult, len(top))
 	total := len(entries)
-	for key, count := range groups {
-		result = append(result, GroupedResult{
-			Key:     key,
-			Count:   count,
-			Percent: float64(count) * 100 / float64(total),
-		})
-	}
-
-	// Sort by count descending
-	sort.Slice(result, func(i, j int) bool {
-		return result[i].Count > result[j].Count
-	})
-
-	// Return top N
-	if len(result) > topN {
-		result = result[:topN]
+	for i, kc := range top {
+		result[i] = GroupedResult{
+			Key:     kc.key,
+			Count:   kc.count,
+			Percent: float64(kc.count) * 100 / float64(total),
+		}
 	}
 
 	return result, nil
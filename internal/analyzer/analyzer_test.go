@@ -0,0 +1,31 @@
+package analyzer
+
+import (
+	"testing"
+
+	"github.com/bimmerbailey/cyro/internal/config"
+)
+
+func TestStatsAccumulator_StatsIsSnapshot(t *testing.T) {
+	acc := NewStatsAccumulator()
+	acc.Add(config.LogEntry{Level: config.LevelError, Message: "boom"})
+
+	stats := acc.Stats(10)
+
+	acc.Add(config.LogEntry{Level: config.LevelError, Message: "boom"})
+	acc.Add(config.LogEntry{Level: config.LevelInfo, Message: "ok"})
+
+	if stats.TotalLines != 1 {
+		t.Errorf("TotalLines = %d, want 1", stats.TotalLines)
+	}
+	if got := stats.LevelCounts[config.LevelError]; got != 1 {
+		t.Errorf("LevelCounts[ERROR] = %d, want 1", got)
+	}
+	if _, ok := stats.LevelCounts[config.LevelInfo]; ok {
+		t.Errorf("LevelCounts has INFO from an entry added after Stats(): %v", stats.LevelCounts)
+	}
+
+	if got := acc.Stats(10).LevelCounts[config.LevelError]; got != 2 {
+		t.Errorf("later Stats() LevelCounts[ERROR] = %d, want 2", got)
+	}
+}
@@ -0,0 +1,62 @@
+package analyzer
+
+import "container/heap"
+
+// keyCount pairs a grouping key with its number of occurrences.
+type keyCount struct {
+	key   string
+	count int
+}
+
+// ranksAbove reports whether a sorts before b: higher counts first, with ties
+// broken by key so results are deterministic.
+func (a keyCount) ranksAbove(b keyCount) bool {
+	if a.count != b.count {
+		return a.count > b.count
+	}
+	return a.key < b.key
+}
+
+// keyCountHeap is a min-heap with the lowest-ranked entry at the root.
+type keyCountHeap []keyCount
+
+func (h keyCountHeap) Len() int            { return len(h) }
+func (h keyCountHeap) Less(i, j int) bool  { return h[j].ranksAbove(h[i]) }
+func (h keyCountHeap) Swap(i, j int)       { h[i], h[j] = h[j], h[i] }
+func (h *keyCountHeap) Push(x interface{}) { *h = append(*h, x.(keyCount)) }
+func (h *keyCountHeap) Pop() interface{} {
+	old := *h
+	n := len(old)
+	x := old[n-1]
+	*h = old[:n-1]
+	return x
+}
+
+// topCounts returns the n highest counts, highest first. It keeps a bounded
+// min-heap of size n, so selecting from m keys costs O(m log n) rather than
+// sorting all m.
+func topCounts(counts map[string]int, n int) []keyCount {
+	if n > len(counts) {
+		n = len(counts)
+	}
+	if n <= 0 {
+		return []keyCount{}
+	}
+
+	h := make(keyCountHeap, 0, n)
+	for key, count := range counts {
+		kc := keyCount{key: key, count: count}
+		if len(h) < n {
+			heap.Push(&h, kc)
+		} else if kc.ranksAbove(h[0]) {
+			h[0] = kc
+			heap.Fix(&h, 0)
+		}
+	}
+
+	result := make([]keyCount, len(h))
+	for i := len(result) - 1; i >= 0; i-- {
+		result[i] = heap.Pop(&h).(keyCount)
+	}
+	return result
+}
@@ -0,0 +1,37 @@
+package analyzer
+
+import (
+	"reflect"
+	"testing"
+)
+
+func TestTopCounts(t *testing.T) {
+	counts := map[string]int{
+		"a": 5,
+		"b": 2,
+		"c": 9,
+		"d": 2,
+		"e": 1,
+	}
+
+	tests := []struct {
+		name string
+		n    int
+		want []keyCount
+	}{
+		{"top 1", 1, []keyCount{{"c", 9}}},
+		{"top 3 breaks ties by key", 3, []keyCount{{"c", 9}, {"a", 5}, {"b", 2}}},
+		{"n larger than input", 10, []keyCount{{"c", 9}, {"a", 5}, {"b", 2}, {"d", 2}, {"e", 1}}},
+		{"zero", 0, []keyCount{}},
+		{"negative", -1, []keyCount{}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := topCounts(counts, tt.n)
+			if !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("topCounts(n=%d) = %v, want %v", tt.n, got, tt.want)
+			}
+		})
+	}
+}
@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"strings"
 	"time"
+	"unicode/utf8"
 )
 
 // Config holds the application-wide configuration.
@@ -77,27 +78,33 @@ const (
 	LevelUnknown
 )
 
+// levelNames maps each known level to its display name, indexed by value.
+var levelNames = [...]string{
+	LevelDebug: "DEBUG",
+	LevelInfo:  "INFO",
+	LevelWarn:  "WARN",
+	LevelError: "ERROR",
+	LevelFatal: "FATAL",
+}
+
 // String returns the string representation of a LogLevel.
 func (l LogLevel) String() string {
-	switch l {
-	case LevelDebug:
-		return "DEBUG"
-	case LevelInfo:
-		return "INFO"
-	case LevelWarn:
-		return "WARN"
-	case LevelError:
-		return "ERROR"
-	case LevelFatal:
-		return "FATAL"
-	default:
+	if l < LevelDebug || l >= LevelUnknown {
 		return "UNKNOWN"
 	}
+	return levelNames[l]
 }
 
 // MarshalJSON implements json.Marshaler for LogLevel.
+// Level names are plain ASCII, so the quoted name is built directly
+// instead of going through json.Marshal.
 func (l LogLevel) MarshalJSON() ([]byte, error) {
-	return json.Marshal(l.String())
+	name := l.String()
+	b := make([]byte, 0, len(name)+2)
+	b = append(b, '"')
+	b = append(b, name...)
+	b = append(b, '"')
+	return b, nil
 }
 
 // UnmarshalJSON implements json.Unmarshaler for LogLevel.
@@ -112,7 +119,15 @@ func (l *LogLevel) UnmarshalJSON(data []byte) error {
 
 // ParseLevel converts a string to a LogLevel.
 func ParseLevel(s string) LogLevel {
-	switch strings.ToLower(s) {
+	// ParseLevel runs for every parsed line, so lower-case short ASCII
+	// input into a stack buffer instead of allocating with strings.ToLower.
+	var buf [8]byte
+	lower, ok := lowerASCII(buf[:], s)
+	if !ok {
+		lower = []byte(strings.ToLower(s))
+	}
+
+	switch string(lower) {
 	case "debug", "dbg":
 		return LevelDebug
 	case "info", "inf":
@@ -128,6 +143,25 @@ func ParseLevel(s string) LogLevel {
 	}
 }
 
+// lowerASCII writes the lower-cased form of s into dst. It reports false if
+// s is longer than dst or contains non-ASCII bytes.
+func lowerASCII(dst []byte, s string) ([]byte, bool) {
+	if len(s) > len(dst) {
+		return nil, false
+	}
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		if c >= utf8.RuneSelf {
+			return nil, false
+		}
+		if 'A' <= c && c <= 'Z' {
+			c += 'a' - 'A'
+		}
+		dst[i] = c
+	}
+	return dst[:len(s)], true
+}
+
 // LogEntry represents a single parsed log line.
 type LogEntry struct {
 	Raw       string                 `json:"raw"`
@@ -5,6 +5,8 @@ import (
 )
 
 func TestParseLevel(t *testing.T) {
+	t.Parallel()
+
 	tests := []struct {
 		name  string
 		input string
@@ -58,6 +60,8 @@ func TestParseLevel(t *testing.T) {
 }
 
 func TestLogLevel_String(t *testing.T) {
+	t.Parallel()
+
 	tests := []struct {
 		name  string
 		level LogLevel
@@ -83,6 +87,8 @@ func TestLogLevel_String(t *testing.T) {
 }
 
 func TestLogLevel_MarshalJSON(t *testing.T) {
+	t.Parallel()
+
 	level := LevelError
 	got, err := level.MarshalJSON()
 	if err != nil {
@@ -101,6 +107,8 @@ func TestLogLevel_MarshalJSON(t *testing.T) {
 }
 
 func TestLogLevel_UnmarshalJSON(t *testing.T) {
+	t.Parallel()
+
 	var level LogLevel
 	err := level.UnmarshalJSON([]byte(`"ERROR"`))
 	if err != nil {
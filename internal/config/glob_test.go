@@ -3,10 +3,13 @@ package config
 import (
 	"os"
 	"path/filepath"
+	"reflect"
 	"testing"
 )
 
 func TestExpandGlobs(t *testing.T) {
+	t.Parallel()
+
 	dir := t.TempDir()
 
 	fileA := filepath.Join(dir, "a.log")
@@ -19,24 +22,28 @@ func TestExpandGlobs(t *testing.T) {
 		}
 	}
 
+	want := []string{fileA, fileB}
+
 	files, err := ExpandGlobs([]string{filepath.Join(dir, "*.log")})
 	if err != nil {
 		t.Fatalf("ExpandGlobs() error = %v", err)
 	}
-	if len(files) != 2 {
-		t.Fatalf("expected 2 files, got %d", len(files))
+	if !reflect.DeepEqual(files, want) {
+		t.Fatalf("ExpandGlobs() = %v, want %v", files, want)
 	}
 
-	files, err = ExpandGlobs([]string{fileA, filepath.Join(dir, "*.log")})
+	files, err = ExpandGlobs([]string{fileB, filepath.Join(dir, "*.log")})
 	if err != nil {
 		t.Fatalf("ExpandGlobs() error = %v", err)
 	}
-	if len(files) != 2 {
-		t.Fatalf("expected 2 files, got %d", len(files))
+	if !reflect.DeepEqual(files, want) {
+		t.Fatalf("ExpandGlobs() = %v, want %v", files, want)
 	}
 }
 
 func TestExpandGlobsNoMatch(t *testing.T) {
+	t.Parallel()
+
 	dir := t.TempDir()
 
 	_, err := ExpandGlobs([]string{filepath.Join(dir, "*.missing")})
@@ -50,13 +50,16 @@ func ParseDuration(s string) (time.Duration, error) {
 	return parseRelativeDuration(s)
 }
 
+// relativeDurationPattern matches one value and unit of an extended
+// duration such as "1d2h".
+var relativeDurationPattern = regexp.MustCompile(`(\d+)([dhms])`)
+
 func parseRelativeDuration(input string) (time.Duration, error) {
 	if d, err := time.ParseDuration(input); err == nil {
 		return d, nil
 	}
 
-	re := regexp.MustCompile(`(\d+)([dhms])`)
-	matches := re.FindAllStringSubmatchIndex(input, -1)
+	matches := relativeDurationPattern.FindAllStringSubmatchIndex(input, -1)
 	if len(matches) == 0 {
 		return 0, fmt.Errorf("invalid relative duration: %s", input)
 	}
@@ -6,6 +6,8 @@ import (
 )
 
 func TestParseTimeRefAbsolute(t *testing.T) {
+	t.Parallel()
+
 	got, err := ParseTimeRef("2025-01-26T10:00:01Z")
 	if err != nil {
 		t.Fatalf("ParseTimeRef() error = %v", err)
@@ -32,6 +34,8 @@ func TestParseTimeRefAbsolute(t *testing.T) {
 }
 
 func TestParseTimeRefRelative(t *testing.T) {
+	t.Parallel()
+
 	start := time.Now()
 	got, err := ParseTimeRef("1h30m")
 	if err != nil {
@@ -58,6 +62,8 @@ func TestParseTimeRefRelative(t *testing.T) {
 }
 
 func TestParseTimeRefInvalid(t *testing.T) {
+	t.Parallel()
+
 	_, err := ParseTimeRef("banana")
 	if err == nil {
 		t.Fatal("expected error for invalid time reference")
@@ -64,6 +64,7 @@ func newOllamaProvider(cfg *config.Config, logger *slog.Logger) (Provider, error
 	return &ollamaProvider{
 		langchainAdapter: adapter,
 		host:             cfg.LLM.Ollama.Host,
+		client:           &http.Client{Timeout: 5 * time.Second},
 	}, nil
 }
 
@@ -146,19 +147,18 @@ func newAnthropicProvider(cfg *config.Config, logger *slog.Logger) (Provider, er
 // ollamaProvider extends langchainAdapter with Ollama-specific health checks.
 type ollamaProvider struct {
 	*langchainAdapter
-	host string
+	host   string
+	client *http.Client // Shared by Heartbeat and ModelAvailable
 }
 
 // Heartbeat checks Ollama server health via /api/tags endpoint.
 func (p *ollamaProvider) Heartbeat(ctx context.Context) error {
-	client := &http.Client{Timeout: 5 * time.Second}
-
 	req, err := http.NewRequestWithContext(ctx, "GET", p.host+"/api/tags", nil)
 	if err != nil {
 		return fmt.Errorf("%w: %v", ErrProviderUnavailable, err)
 	}
 
-	resp, err := client.Do(req)
+	resp, err := p.client.Do(req)
 	if err != nil {
 		return fmt.Errorf("%w: %v", ErrProviderUnavailable, err)
 	}
@@ -171,26 +171,22 @@ func (p *ollamaProvider) Heartbeat(ctx context.Context) error {
 	return nil
 }
 
+// maxTagsResponseSize caps how much of an Ollama /api/tags response is read.
+const maxTagsResponseSize = 4 << 20 // 4MB
+
 // ModelAvailable checks if a specific model has been pulled to Ollama.
 func (p *ollamaProvider) ModelAvailable(ctx context.Context, model string) (bool, error) {
-	client := &http.Client{Timeout: 5 * time.Second}
-
 	req, err := http.NewRequestWithContext(ctx, "GET", p.host+"/api/tags", nil)
 	if err != nil {
 		return false, err
 	}
 
-	resp, err := client.Do(req)
+	resp, err := p.client.Do(req)
 	if err != nil {
 		return false, err
 	}
 	defer resp.Body.Close()
 
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return false, err
-	}
-
 	var result struct {
 		Models []struct {
 			Name  string `json:"name"`
@@ -198,7 +194,9 @@ func (p *ollamaProvider) ModelAvailable(ctx context.Context, model string) (bool
 		} `json:"models"`
 	}
 
-	if err := json.Unmarshal(body, &result); err != nil {
+	// Decode straight from the body, capped so a misbehaving server cannot
+	// make us buffer an unbounded response.
+	if err := json.NewDecoder(io.LimitReader(resp.Body, maxTagsResponseSize)).Decode(&result); err != nil {
 		return false, err
 	}
 
@@ -48,38 +48,36 @@ func shouldColorize(mode ColorMode, w interface{}) bool {
 	return false
 }
 
+// ResolveColorMode resolves ColorAuto against w once, returning ColorAlways
+// or ColorNever. Callers writing many entries to the same destination can
+// resolve the mode up front instead of checking for a TTY on every line.
+func ResolveColorMode(mode ColorMode, w interface{}) ColorMode {
+	if shouldColorize(mode, w) {
+		return ColorAlways
+	}
+	return ColorNever
+}
+
+// levelColors holds the ANSI prefix for each log level. Levels without an
+// entry (INFO, UNKNOWN) use the terminal's default color.
+var levelColors = [...]string{
+	config.LevelDebug: colorGray,
+	config.LevelWarn:  colorYellow,
+	config.LevelError: colorRed,
+	config.LevelFatal: colorBold + colorRed,
+}
+
 // colorizeLevel adds color to a log level string based on severity.
 func colorizeLevel(level config.LogLevel, text string) string {
-	switch level {
-	case config.LevelDebug:
-		return colorGray + text + colorReset
-	case config.LevelInfo:
-		return text // Default color
-	case config.LevelWarn:
-		return colorYellow + text + colorReset
-	case config.LevelError:
-		return colorRed + text + colorReset
-	case config.LevelFatal:
-		return colorBold + colorRed + text + colorReset
-	default:
-		return text
-	}
+	return ColorizeLine(level, text)
 }
 
 // ColorizeLine applies color to an entire log line based on its level.
 func ColorizeLine(level config.LogLevel, line string) string {
-	switch level {
-	case config.LevelDebug:
-		return colorGray + line + colorReset
-	case config.LevelWarn:
-		return colorYellow + line + colorReset
-	case config.LevelError:
-		return colorRed + line + colorReset
-	case config.LevelFatal:
-		return colorBold + colorRed + line + colorReset
-	default:
-		return line // INFO and UNKNOWN use default color
+	if level < 0 || int(level) >= len(levelColors) || levelColors[level] == "" {
+		return line
 	}
+	return levelColors[level] + line + colorReset
 }
 
 // FormatEntry formats a single log entry with optional coloring.
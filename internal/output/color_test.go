@@ -220,6 +220,27 @@ func TestShouldColorize(t *testing.T) {
 	}
 }
 
+func TestResolveColorMode(t *testing.T) {
+	tests := []struct {
+		name     string
+		mode     ColorMode
+		writer   interface{}
+		expected ColorMode
+	}{
+		{"ColorAlways", ColorAlways, &bytes.Buffer{}, ColorAlways},
+		{"ColorNever", ColorNever, os.Stdout, ColorNever},
+		{"ColorAuto - non-file writer", ColorAuto, &bytes.Buffer{}, ColorNever},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := ResolveColorMode(tt.mode, tt.writer); got != tt.expected {
+				t.Errorf("ResolveColorMode() = %v, expected %v", got, tt.expected)
+			}
+		})
+	}
+}
+
 func TestWriteColoredEntry(t *testing.T) {
 	entry := config.LogEntry{
 		Raw:   "test error message",
@@ -3,9 +3,11 @@
 package output
 
 import (
+	"bufio"
 	"encoding/json"
 	"fmt"
 	"io"
+	"strconv"
 	"strings"
 	"text/tabwriter"
 
@@ -68,10 +70,15 @@ func (wr *Writer) writeJSON(entries []config.LogEntry) error {
 }
 
 func (wr *Writer) writeText(entries []config.LogEntry) error {
+	// Buffer the lines so large result sets are written in a few large
+	// writes instead of one write per entry. The first write error is
+	// kept by the bufio.Writer and returned by Flush.
+	bw := bufio.NewWriter(wr.w)
 	for _, e := range entries {
-		fmt.Fprintln(wr.w, e.Raw)
+		_, _ = bw.WriteString(e.Raw)
+		_ = bw.WriteByte('\n')
 	}
-	return nil
+	return bw.Flush()
 }
 
 func (wr *Writer) writeTable(entries []config.LogEntry) error {
@@ -79,18 +86,31 @@ func (wr *Writer) writeTable(entries []config.LogEntry) error {
 	fmt.Fprintln(tw, "LINE\tLEVEL\tTIMESTAMP\tMESSAGE")
 	fmt.Fprintln(tw, "----\t-----\t---------\t-------")
 
+	// Build each row in a reused buffer rather than formatting it with
+	// fmt.Fprintf and a fresh timestamp string per entry.
+	row := make([]byte, 0, 128)
 	for _, e := range entries {
-		ts := ""
+		row = strconv.AppendInt(row[:0], int64(e.Line), 10)
+		row = append(row, '\t')
+		row = append(row, e.Level.String()...)
+		row = append(row, '\t')
 		if !e.Timestamp.IsZero() {
-			ts = e.Timestamp.Format("15:04:05")
+			row = e.Timestamp.AppendFormat(row, "15:04:05")
 		}
+		row = append(row, '\t')
 
 		msg := e.Message
 		if len(msg) > 80 {
-			msg = msg[:77] + "..."
+			row = append(row, msg[:77]...)
+			row = append(row, "..."...)
+		} else {
+			row = append(row, msg...)
 		}
+		row = append(row, '\n')
 
-		fmt.Fprintf(tw, "%d\t%s\t%s\t%s\n", e.Line, e.Level, ts, msg)
+		if _, err := tw.Write(row); err != nil {
+			return err
+		}
 	}
 
 	return tw.Flush()
@@ -6,11 +6,14 @@ package parser
 
 import (
 	"bufio"
+	"bytes"
 	"encoding/json"
 	"io"
 	"os"
 	"regexp"
+	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/bimmerbailey/cyro/internal/config"
@@ -33,12 +36,9 @@ type Parser struct {
 
 // DetectFormat attempts to detect the log format from a line.
 func DetectFormat(line string) Format {
-	// Try JSON
-	if len(line) > 0 && line[0] == '{' {
-		var data map[string]interface{}
-		if err := json.Unmarshal([]byte(line), &data); err == nil {
-			return FormatJSON
-		}
+	// Try JSON (validate only; the decoded value is not needed here)
+	if len(line) > 0 && line[0] == '{' && json.Valid([]byte(line)) {
+		return FormatJSON
 	}
 
 	// Try syslog pattern
@@ -89,25 +89,41 @@ func (p *Parser) Parse(r io.Reader) ([]config.LogEntry, error) {
 	return entries, err
 }
 
+// maxScanTokenSize is the longest line the parser accepts.
+const maxScanTokenSize = 1024 * 1024 // 1MB
+
+// scanBufPool reuses scanner buffers across ParseStream calls so parsing many
+// files does not allocate a fresh 1MB buffer for each one.
+var scanBufPool = sync.Pool{
+	New: func() interface{} {
+		buf := make([]byte, maxScanTokenSize)
+		return &buf
+	},
+}
+
 // ParseStream reads log entries from the given reader and calls fn for each entry.
 // The callback can return an error to stop parsing early.
 func (p *Parser) ParseStream(r io.Reader, fn func(config.LogEntry) error) error {
 	scanner := bufio.NewScanner(r)
 
 	// Increase buffer size to handle long lines (default is 64KB, we use 1MB)
-	const maxScanTokenSize = 1024 * 1024 // 1MB
-	buf := make([]byte, maxScanTokenSize)
-	scanner.Buffer(buf, maxScanTokenSize)
+	buf := scanBufPool.Get().(*[]byte)
+	defer scanBufPool.Put(buf)
+	scanner.Buffer(*buf, maxScanTokenSize)
 
 	lineNum := 0
 	for scanner.Scan() {
 		lineNum++
-		line := scanner.Text()
-		if strings.TrimSpace(line) == "" {
+		// Skip empty lines before allocating a string for them
+		raw := scanner.Bytes()
+		if len(bytes.TrimSpace(raw)) == 0 {
 			continue
 		}
+		line := string(raw)
 
-		entry := p.parseLine(line, lineNum)
+		// Hand the scanner's bytes to the JSON decoder so the line is not
+		// copied back out of the string a second time.
+		entry := p.parseLine(line, raw, lineNum)
 		if err := fn(entry); err != nil {
 			return err
 		}
@@ -127,8 +143,32 @@ func (p *Parser) ParseFileStream(path string, fn func(config.LogEntry) error) er
 	return p.ParseStream(f, fn)
 }
 
-// parseLine attempts to parse a single log line into a LogEntry.
-func (p *Parser) parseLine(line string, lineNum int) config.LogEntry {
+// timestampPrefixPatterns match leading timestamps that ParseLine strips
+// from the message.
+var timestampPrefixPatterns = []*regexp.Regexp{
+	regexp.MustCompile(`^\[?\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?\]?\s*`),
+	regexp.MustCompile(`^\[?\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:\.\d+)?\]?\s*`),
+	regexp.MustCompile(`^\[?\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}\]?\s*`),
+}
+
+// mayStartTimestamp reports whether s could begin with one of the
+// timestampPrefixPatterns.
+func mayStartTimestamp(s string) bool {
+	return len(s) > 0 && (s[0] == '[' || '0' <= s[0] && s[0] <= '9')
+}
+
+// levelPrefixPattern matches a leading level marker such as [INFO] or (ERROR).
+var levelPrefixPattern = regexp.MustCompile(`^\s*[\[\(]?(DEBUG|INFO|WARN(?:ING)?|ERROR|FATAL|CRITICAL)[\]\)]?\s*[-:]?\s*`)
+
+// ParseLine parses a single log line into a LogEntry, trying JSON, syslog,
+// Apache, and generic formats in turn. lineNum is recorded on the entry.
+func (p *Parser) ParseLine(line string, lineNum int) config.LogEntry {
+	return p.parseLine(line, nil, lineNum)
+}
+
+// parseLine implements ParseLine. raw, if non-nil, holds the bytes of line
+// and is used for JSON decoding instead of converting line again.
+func (p *Parser) parseLine(line string, raw []byte, lineNum int) config.LogEntry {
 	entry := config.LogEntry{
 		Raw:    line,
 		Line:   lineNum,
@@ -137,7 +177,7 @@ func (p *Parser) parseLine(line string, lineNum int) config.LogEntry {
 	}
 
 	// Try JSON first
-	if p.tryParseJSON(line, &entry) {
+	if p.tryParseJSON(line, raw, &entry) {
 		return entry
 	}
 
@@ -158,7 +198,7 @@ func (p *Parser) parseLine(line string, lineNum int) config.LogEntry {
 	entry.Timestamp = p.extractTimestamp(line)
 
 	// Try to extract log level
-	levelMatch := levelPattern.FindString(line)
+	levelMatch := findLevel(line)
 	if levelMatch != "" {
 		entry.Level = config.ParseLevel(levelMatch)
 		// Remove the level from the cleaned line
@@ -167,18 +207,18 @@ func (p *Parser) parseLine(line string, lineNum int) config.LogEntry {
 		entry.Level = config.LevelUnknown
 	}
 
-	// Try to remove common timestamp patterns from message
-	timestampPatterns := []*regexp.Regexp{
-		regexp.MustCompile(`^\[?\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?\]?\s*`),
-		regexp.MustCompile(`^\[?\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:\.\d+)?\]?\s*`),
-		regexp.MustCompile(`^\[?\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}\]?\s*`),
-	}
-	for _, pattern := range timestampPatterns {
+	// Try to remove common timestamp patterns from message. Every pattern
+	// starts with an optional '[' and a digit, so skip the regexps for lines
+	// that cannot match.
+	for _, pattern := range timestampPrefixPatterns {
+		if !mayStartTimestamp(cleanedLine) {
+			break
+		}
 		cleanedLine = pattern.ReplaceAllString(cleanedLine, "")
 	}
 
 	// Remove common prefixes like [INFO], (ERROR), etc.
-	cleanedLine = regexp.MustCompile(`^\s*[\[\(]?(DEBUG|INFO|WARN(?:ING)?|ERROR|FATAL|CRITICAL)[\]\)]?\s*[-:]?\s*`).ReplaceAllString(cleanedLine, "")
+	cleanedLine = levelPrefixPattern.ReplaceAllString(cleanedLine, "")
 
 	// Trim whitespace
 	entry.Message = strings.TrimSpace(cleanedLine)
@@ -189,33 +229,45 @@ func (p *Parser) parseLine(line string, lineNum int) config.LogEntry {
 	return entry
 }
 
-// tryParseJSON attempts to parse the line as a JSON log entry.
-func (p *Parser) tryParseJSON(line string, entry *config.LogEntry) bool {
+// Keys checked, in order, for the message, level, and timestamp of a JSON
+// log line. The first key present with a usable value wins.
+var (
+	jsonMessageKeys   = []string{"msg", "message", "text"}
+	jsonLevelKeys     = []string{"level", "severity", "lvl"}
+	jsonTimestampKeys = []string{"time", "timestamp", "ts", "@timestamp"}
+)
+
+// tryParseJSON attempts to parse the line as a JSON log entry. raw, if
+// non-nil, holds the bytes of line.
+func (p *Parser) tryParseJSON(line string, raw []byte, entry *config.LogEntry) bool {
 	if len(line) == 0 || line[0] != '{' {
 		return false
 	}
+	if raw == nil {
+		raw = []byte(line)
+	}
 
 	var data map[string]interface{}
-	if err := json.Unmarshal([]byte(line), &data); err != nil {
+	if err := json.Unmarshal(raw, &data); err != nil {
 		return false
 	}
 
 	// Extract common JSON log fields
-	for _, key := range []string{"msg", "message", "text"} {
+	for _, key := range jsonMessageKeys {
 		if v, ok := data[key].(string); ok {
 			entry.Message = v
 			break
 		}
 	}
 
-	for _, key := range []string{"level", "severity", "lvl"} {
+	for _, key := range jsonLevelKeys {
 		if v, ok := data[key].(string); ok {
 			entry.Level = config.ParseLevel(v)
 			break
 		}
 	}
 
-	for _, key := range []string{"time", "timestamp", "ts", "@timestamp"} {
+	for _, key := range jsonTimestampKeys {
 		if v, ok := data[key].(string); ok {
 			entry.Timestamp = p.parseTimestamp(v)
 			break
@@ -254,8 +306,33 @@ func (p *Parser) tryParseJSON(line string, entry *config.LogEntry) bool {
 // Optionally with priority: <N>Jan 02 15:04:05 hostname process[pid]: message
 var syslogPattern = regexp.MustCompile(`^(?:<(\d+)>)?(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+(\S+?)(?:\[(\d+)\])?:\s+(.*)$`)
 
+// syslogSeverityLevels maps a syslog severity (0-7) to a LogLevel.
+var syslogSeverityLevels = [8]config.LogLevel{
+	0: config.LevelFatal, // emerg
+	1: config.LevelFatal, // alert
+	2: config.LevelFatal, // crit
+	3: config.LevelError,
+	4: config.LevelWarn,
+	5: config.LevelInfo, // notice
+	6: config.LevelInfo,
+	7: config.LevelDebug,
+}
+
+// mayBeSyslog reports whether line could match syslogPattern: it must start
+// with a priority or with a three-letter month followed by whitespace.
+func mayBeSyslog(line string) bool {
+	if len(line) > 0 && line[0] == '<' {
+		return true
+	}
+	return len(line) > 3 && isWordByte(line[0]) && isWordByte(line[1]) && isWordByte(line[2]) &&
+		strings.IndexByte(" \t\n\f\r", line[3]) >= 0
+}
+
 // tryParseSyslog attempts to parse the line as a syslog entry.
 func (p *Parser) tryParseSyslog(line string, entry *config.LogEntry) bool {
+	if !mayBeSyslog(line) {
+		return false
+	}
 	matches := syslogPattern.FindStringSubmatch(line)
 	if matches == nil {
 		return false
@@ -270,9 +347,7 @@ func (p *Parser) tryParseSyslog(line string, entry *config.LogEntry) bool {
 
 	// Parse timestamp (syslog format: Jan 02 15:04:05)
 	// Note: syslog doesn't include year, we'll use current year
-	timestampStr := matches[2]
-	currentYear := time.Now().Year()
-	fullTimestamp := timestampStr + " " + time.Now().Format("2006")
+	fullTimestamp := matches[2] + " " + strconv.Itoa(time.Now().Year())
 	for _, format := range []string{
 		"Jan 02 15:04:05 2006",
 		"Jan  2 15:04:05 2006",
@@ -282,7 +357,6 @@ func (p *Parser) tryParseSyslog(line string, entry *config.LogEntry) bool {
 			break
 		}
 	}
-	_ = currentYear // unused for now, keeping for future use
 
 	// Extract hostname as source
 	entry.Source = matches[3]
@@ -299,28 +373,14 @@ func (p *Parser) tryParseSyslog(line string, entry *config.LogEntry) bool {
 	if matches[1] != "" {
 		// Syslog priority = facility * 8 + severity
 		// Severity: 0=emerg, 1=alert, 2=crit, 3=error, 4=warning, 5=notice, 6=info, 7=debug
-		priority := matches[1]
-		if len(priority) > 0 {
-			// Parse the priority number to get severity
-			var priorityNum int
-			if _, err := regexp.MatchString(`^\d+$`, priority); err == nil {
-				for _, ch := range priority {
-					priorityNum = priorityNum*10 + int(ch-'0')
-				}
-				severity := priorityNum % 8 // Last 3 bits are severity
-				switch severity {
-				case 7:
-					entry.Level = config.LevelDebug
-				case 6, 5:
-					entry.Level = config.LevelInfo
-				case 4:
-					entry.Level = config.LevelWarn
-				case 3:
-					entry.Level = config.LevelError
-				case 2, 1, 0:
-					entry.Level = config.LevelFatal
-				}
-			}
+		// The pattern only captures digits, so the priority parses directly
+		var priorityNum int
+		for _, ch := range matches[1] {
+			priorityNum = priorityNum*10 + int(ch-'0')
+		}
+		// Last 3 bits are severity; an overflowed priority leaves the level unset
+		if severity := priorityNum % 8; severity >= 0 {
+			entry.Level = syslogSeverityLevels[severity]
 		}
 	}
 
@@ -341,6 +401,10 @@ var apachePattern = regexp.MustCompile(`^(\S+) (\S+) (\S+) \[([^\]]+)\] "(\S+) (
 
 // tryParseApache attempts to parse the line as an Apache/Nginx Combined Log Format entry.
 func (p *Parser) tryParseApache(line string, entry *config.LogEntry) bool {
+	// Every match contains the closing timestamp bracket and opening quote
+	if !strings.Contains(line, `] "`) {
+		return false
+	}
 	matches := apachePattern.FindStringSubmatch(line)
 	if matches == nil {
 		return false
@@ -409,34 +473,82 @@ func (p *Parser) tryParseApache(line string, entry *config.LogEntry) bool {
 	return true
 }
 
-// levelPattern matches common log level strings.
-var levelPattern = regexp.MustCompile(`(?i)\b(DEBUG|INFO|WARN(?:ING)?|ERROR|FATAL|CRITICAL)\b`)
+// levelWords are the level names findLevel recognizes. WARNING precedes
+// WARN so the longer word wins.
+var levelWords = []string{"DEBUG", "INFO", "WARNING", "WARN", "ERROR", "FATAL", "CRITICAL"}
+
+// findLevel returns the first level name in line that stands as a whole
+// word, matched case-insensitively, or "" if there is none. It matches
+// what the regexp (?i)\b(DEBUG|INFO|WARN(?:ING)?|ERROR|FATAL|CRITICAL)\b
+// would, without running a case-folding regexp over every line.
+func findLevel(line string) string {
+	for i := 0; i < len(line); i++ {
+		if i > 0 && isWordByte(line[i-1]) {
+			continue
+		}
+		for _, word := range levelWords {
+			end := i + len(word)
+			if end > len(line) || !hasPrefixUpper(line[i:], word) {
+				continue
+			}
+			if end == len(line) || !isWordByte(line[end]) {
+				return line[i:end]
+			}
+		}
+	}
+	return ""
+}
+
+// hasPrefixUpper reports whether s begins with upper, ignoring ASCII case.
+// upper must be upper-case ASCII.
+func hasPrefixUpper(s, upper string) bool {
+	if len(s) < len(upper) {
+		return false
+	}
+	for j := 0; j < len(upper); j++ {
+		c := s[j]
+		if 'a' <= c && c <= 'z' {
+			c -= 'a' - 'A'
+		}
+		if c != upper[j] {
+			return false
+		}
+	}
+	return true
+}
+
+// isWordByte reports whether c is an ASCII word character, as in \w.
+func isWordByte(c byte) bool {
+	return c == '_' || '0' <= c && c <= '9' || 'a' <= c && c <= 'z' || 'A' <= c && c <= 'Z'
+}
 
 // extractLevel extracts the log level from a line.
 func (p *Parser) extractLevel(line string) config.LogLevel {
-	match := levelPattern.FindString(line)
+	match := findLevel(line)
 	if match == "" {
 		return config.LevelUnknown
 	}
 	return config.ParseLevel(match)
 }
 
+// timestampPatterns locate timestamps anywhere in a line, paired with the
+// layout used to parse the match.
+var timestampPatterns = []struct {
+	regex  *regexp.Regexp
+	format string
+}{
+	// ISO 8601 / RFC3339
+	{regexp.MustCompile(`\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})`), "2006-01-02T15:04:05Z07:00"},
+	{regexp.MustCompile(`\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z`), "2006-01-02T15:04:05Z"},
+	// Common datetime
+	{regexp.MustCompile(`\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}`), "2006-01-02 15:04:05"},
+	{regexp.MustCompile(`\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}`), "01/02/2006 15:04:05"},
+}
+
 // extractTimestamp tries all known timestamp formats against the line.
 // It searches for timestamps at the beginning, inside brackets, or elsewhere in the line.
 func (p *Parser) extractTimestamp(line string) time.Time {
 	// Try common timestamp patterns with regex first for better detection
-	timestampPatterns := []struct {
-		regex  *regexp.Regexp
-		format string
-	}{
-		// ISO 8601 / RFC3339
-		{regexp.MustCompile(`\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})`), "2006-01-02T15:04:05Z07:00"},
-		{regexp.MustCompile(`\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z`), "2006-01-02T15:04:05Z"},
-		// Common datetime
-		{regexp.MustCompile(`\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}`), "2006-01-02 15:04:05"},
-		{regexp.MustCompile(`\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}`), "01/02/2006 15:04:05"},
-	}
-
 	for _, tp := range timestampPatterns {
 		if match := tp.regex.FindString(line); match != "" {
 			if t, err := time.Parse(tp.format, match); err == nil {
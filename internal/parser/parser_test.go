@@ -9,6 +9,8 @@ import (
 )
 
 func TestDetectFormat(t *testing.T) {
+	t.Parallel()
+
 	tests := []struct {
 		name  string
 		input string
@@ -57,6 +59,8 @@ func TestDetectFormat(t *testing.T) {
 }
 
 func TestParser_ParseJSON(t *testing.T) {
+	t.Parallel()
+
 	p := New(nil)
 
 	tests := []struct {
@@ -115,7 +119,7 @@ func TestParser_ParseJSON(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			entry := p.parseLine(tt.input, 1)
+			entry := p.ParseLine(tt.input, 1)
 
 			if entry.Level != tt.wantLevel {
 				t.Errorf("Level = %v, want %v", entry.Level, tt.wantLevel)
@@ -143,6 +147,8 @@ func TestParser_ParseJSON(t *testing.T) {
 }
 
 func TestParser_ParseSyslog(t *testing.T) {
+	t.Parallel()
+
 	p := New(nil)
 
 	tests := []struct {
@@ -187,7 +193,7 @@ func TestParser_ParseSyslog(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			entry := p.parseLine(tt.input, 1)
+			entry := p.ParseLine(tt.input, 1)
 
 			if entry.Level != tt.wantLevel {
 				t.Errorf("Level = %v, want %v", entry.Level, tt.wantLevel)
@@ -211,6 +217,8 @@ func TestParser_ParseSyslog(t *testing.T) {
 }
 
 func TestParser_ParseApache(t *testing.T) {
+	t.Parallel()
+
 	p := New(nil)
 
 	tests := []struct {
@@ -257,7 +265,7 @@ func TestParser_ParseApache(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			entry := p.parseLine(tt.input, 1)
+			entry := p.ParseLine(tt.input, 1)
 
 			if entry.Level != tt.wantLevel {
 				t.Errorf("Level = %v, want %v", entry.Level, tt.wantLevel)
@@ -281,6 +289,8 @@ func TestParser_ParseApache(t *testing.T) {
 }
 
 func TestParser_ParseGeneric(t *testing.T) {
+	t.Parallel()
+
 	p := New(nil)
 
 	tests := []struct {
@@ -327,7 +337,7 @@ func TestParser_ParseGeneric(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			entry := p.parseLine(tt.input, 1)
+			entry := p.ParseLine(tt.input, 1)
 
 			if entry.Level != tt.wantLevel {
 				t.Errorf("Level = %v, want %v", entry.Level, tt.wantLevel)
@@ -343,6 +353,8 @@ func TestParser_ParseGeneric(t *testing.T) {
 }
 
 func TestParser_ParseStream(t *testing.T) {
+	t.Parallel()
+
 	p := New(nil)
 
 	input := `{"timestamp": "2025-01-26T10:00:01Z", "level": "info", "message": "line 1"}
@@ -376,17 +388,18 @@ func TestParser_ParseStream(t *testing.T) {
 	})
 
 	t.Run("Early termination", func(t *testing.T) {
+		errStop := errors.New("stop")
 		count := 0
 		err := p.ParseStream(strings.NewReader(input), func(entry config.LogEntry) error {
 			count++
 			if count >= 2 {
-				return errors.New("stop")
+				return errStop
 			}
 			return nil
 		})
 
-		if err == nil {
-			t.Error("Expected error from early termination")
+		if !errors.Is(err, errStop) {
+			t.Errorf("ParseStream() error = %v, want the callback's error", err)
 		}
 		if count != 2 {
 			t.Errorf("callback called %d times, want 2", count)
@@ -395,6 +408,8 @@ func TestParser_ParseStream(t *testing.T) {
 }
 
 func TestParser_Parse(t *testing.T) {
+	t.Parallel()
+
 	p := New(nil)
 
 	input := `{"timestamp": "2025-01-26T10:00:01Z", "level": "info", "message": "test 1"}
@@ -411,6 +426,8 @@ func TestParser_Parse(t *testing.T) {
 }
 
 func TestParser_SkipBlankLines(t *testing.T) {
+	t.Parallel()
+
 	p := New(nil)
 
 	input := `{"timestamp": "2025-01-26T10:00:01Z", "level": "info", "message": "line 1"}
@@ -430,10 +447,12 @@ func TestParser_SkipBlankLines(t *testing.T) {
 }
 
 func TestParser_CustomTimestampFormats(t *testing.T) {
+	t.Parallel()
+
 	customFormats := []string{"01/02/2006 15:04:05"}
 	p := New(customFormats)
 
-	entry := p.parseLine("01/26/2025 10:00:01 ERROR Custom timestamp format", 1)
+	entry := p.ParseLine("01/26/2025 10:00:01 ERROR Custom timestamp format", 1)
 
 	if entry.Timestamp.IsZero() {
 		t.Error("Expected non-zero timestamp with custom format")
@@ -444,6 +463,8 @@ func TestParser_CustomTimestampFormats(t *testing.T) {
 }
 
 func TestParser_LongLine(t *testing.T) {
+	t.Parallel()
+
 	p := New(nil)
 
 	// Create a line longer than the default bufio.Scanner buffer (64KB)
@@ -465,6 +486,8 @@ func TestParser_LongLine(t *testing.T) {
 }
 
 func TestExtractTimestamp(t *testing.T) {
+	t.Parallel()
+
 	p := New(nil)
 
 	tests := []struct {
@@ -512,13 +535,42 @@ func TestExtractTimestamp(t *testing.T) {
 	}
 }
 
+func TestFindLevel(t *testing.T) {
+	t.Parallel()
+
+	tests := []struct {
+		name  string
+		input string
+		want  string
+	}{
+		{"uppercase", "2025-01-26 ERROR disk full", "ERROR"},
+		{"lowercase", "level=info started", "info"},
+		{"bracketed", "[Warn] slow request", "Warn"},
+		{"warning preferred over warn", "WARNING: low memory", "WARNING"},
+		{"first match wins", "INFO retrying after ERROR", "INFO"},
+		{"end of line", "status: fatal", "fatal"},
+		{"inside word", "errors=0 information", ""},
+		{"underscore is a word character", "LOG_ERROR happened", ""},
+		{"no level", "plain message", ""},
+		{"empty", "", ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := findLevel(tt.input); got != tt.want {
+				t.Errorf("findLevel(%q) = %q, want %q", tt.input, got, tt.want)
+			}
+		})
+	}
+}
+
 func BenchmarkParser_ParseJSON(b *testing.B) {
 	p := New(nil)
 	line := `{"timestamp": "2025-01-26T10:00:01Z", "level": "error", "message": "test message", "user": "admin", "status_code": 500}`
 
 	b.ResetTimer()
 	for i := 0; i < b.N; i++ {
-		_ = p.parseLine(line, 1)
+		_ = p.ParseLine(line, 1)
 	}
 }
 
@@ -528,7 +580,7 @@ func BenchmarkParser_ParseSyslog(b *testing.B) {
 
 	b.ResetTimer()
 	for i := 0; i < b.N; i++ {
-		_ = p.parseLine(line, 1)
+		_ = p.ParseLine(line, 1)
 	}
 }
 
@@ -538,6 +590,32 @@ func BenchmarkParser_ParseApache(b *testing.B) {
 
 	b.ResetTimer()
 	for i := 0; i < b.N; i++ {
-		_ = p.parseLine(line, 1)
+		_ = p.ParseLine(line, 1)
+	}
+}
+
+func BenchmarkParser_ParseGeneric(b *testing.B) {
+	p := New(nil)
+	line := "2025-01-26 10:00:01 ERROR [worker-3] failed to process job 42: connection refused"
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		_ = p.ParseLine(line, 1)
+	}
+}
+
+func BenchmarkParser_ParseStream(b *testing.B) {
+	p := New(nil)
+	input := strings.Repeat(`{"timestamp": "2025-01-26T10:00:01Z", "level": "info", "message": "request served", "status_code": 200}
+Jan 26 10:00:02 web-01 sshd[1234]: Accepted password for admin from 192.168.1.100
+2025-01-26 10:00:03 WARN cache miss for key user:42
+`, 100)
+
+	b.SetBytes(int64(len(input)))
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		if err := p.ParseStream(strings.NewReader(input), func(config.LogEntry) error { return nil }); err != nil {
+			b.Fatal(err)
+		}
 	}
 }
@@ -2,6 +2,7 @@ package preprocess
 
 import (
 	"fmt"
+	"sort"
 	"strings"
 	"time"
 
@@ -124,11 +125,24 @@ func (c *Compressor) createTemplateSummaries(
 	// Build a map of template ID -> entries matching it
 	templateEntries := make(map[string][]config.LogEntry)
 
-	// Create a simple matcher for Drain templates
+	// Tokenize each template pattern and each message once, then match
+	// the token slices against each other. Templates only match messages
+	// with the same token count, so index them by length (keeping their
+	// original order) and only try candidates of the right length.
+	templateTokens := make([][]string, len(drainTemplates))
+	byLength := make(map[int][]int)
+	for i, template := range drainTemplates {
+		templateTokens[i] = strings.Fields(template.Pattern)
+		n := len(templateTokens[i])
+		byLength[n] = append(byLength[n], i)
+	}
+
 	for _, entry := range entries {
-		for _, template := range drainTemplates {
-			if c.matchesTemplate(entry.Message, template) {
-				templateEntries[template.ID] = append(templateEntries[template.ID], entry)
+		messageTokens := strings.Fields(entry.Message)
+		for _, i := range byLength[len(messageTokens)] {
+			if c.matchesTemplate(messageTokens, templateTokens[i]) {
+				id := drainTemplates[i].ID
+				templateEntries[id] = append(templateEntries[id], entry)
 				break
 			}
 		}
@@ -173,13 +187,10 @@ func (c *Compressor) createTemplateSummaries(
 	return summaries
 }
 
-// matchesTemplate checks if a message matches a Drain template pattern.
-func (c *Compressor) matchesTemplate(message string, template *Template) bool {
+// matchesTemplate checks if a tokenized message matches a tokenized Drain
+// template pattern.
+func (c *Compressor) matchesTemplate(messageTokens, templateTokens []string) bool {
 	// Simple matching: check if message could match the template pattern
-	// This is a simplified version - in practice, we'd need proper tokenization
-	messageTokens := strings.Fields(message)
-	templateTokens := strings.Fields(template.Pattern)
-
 	if len(messageTokens) != len(templateTokens) {
 		return false
 	}
@@ -199,19 +210,28 @@ func (c *Compressor) matchesTemplate(message string, template *Template) bool {
 // prioritizeTemplates sorts templates by severity and frequency.
 // Errors come first, then warnings, then by frequency.
 func (c *Compressor) prioritizeTemplates(templates []TemplateSummary) []TemplateSummary {
-	// Simple bubble sort for clarity
-	for i := 0; i < len(templates)-1; i++ {
-		for j := i + 1; j < len(templates); j++ {
-			scoreI := c.templatePriorityScore(templates[i])
-			scoreJ := c.templatePriorityScore(templates[j])
-			if scoreJ > scoreI {
-				templates[i], templates[j] = templates[j], templates[i]
-			}
-		}
+	// Score each template once rather than on every comparison
+	scores := make([]float64, len(templates))
+	for i, t := range templates {
+		scores[i] = c.templatePriorityScore(t)
 	}
+	sort.Stable(byPriority{templates: templates, scores: scores})
 	return templates
 }
 
+// byPriority sorts templates by descending precomputed priority score.
+type byPriority struct {
+	templates []TemplateSummary
+	scores    []float64
+}
+
+func (b byPriority) Len() int           { return len(b.templates) }
+func (b byPriority) Less(i, j int) bool { return b.scores[i] > b.scores[j] }
+func (b byPriority) Swap(i, j int) {
+	b.templates[i], b.templates[j] = b.templates[j], b.templates[i]
+	b.scores[i], b.scores[j] = b.scores[j], b.scores[i]
+}
+
 // templatePriorityScore calculates a priority score for sorting.
 // Higher score = higher priority.
 func (c *Compressor) templatePriorityScore(t TemplateSummary) float64 {
@@ -263,15 +283,15 @@ func (c *Compressor) writeHeader(sb *strings.Builder, output *CompressedOutput)
 	sb.WriteString("=== Log Analysis Summary ===\n\n")
 
 	if !output.TimeRange.Start.IsZero() {
-		sb.WriteString(fmt.Sprintf("Time Range: %s to %s\n",
+		fmt.Fprintf(sb, "Time Range: %s to %s\n",
 			output.TimeRange.Start.Format(time.RFC3339),
-			output.TimeRange.End.Format(time.RFC3339)))
+			output.TimeRange.End.Format(time.RFC3339))
 	}
 
-	sb.WriteString(fmt.Sprintf("Total Lines: %d\n", output.TotalLines))
-	sb.WriteString(fmt.Sprintf("Unique Patterns: %d\n", output.TotalTemplates))
+	fmt.Fprintf(sb, "Total Lines: %d\n", output.TotalLines)
+	fmt.Fprintf(sb, "Unique Patterns: %d\n", output.TotalTemplates)
 	if output.RedactedCount > 0 {
-		sb.WriteString(fmt.Sprintf("Sensitive Values Redacted: %d\n", output.RedactedCount))
+		fmt.Fprintf(sb, "Sensitive Values Redacted: %d\n", output.RedactedCount)
 	}
 	sb.WriteString("\n")
 }
@@ -368,7 +388,7 @@ func (c *Compressor) formatTemplate(t TemplateSummary) string {
 
 	// Severity prefix
 	levelStr := t.Level.String()
-	sb.WriteString(fmt.Sprintf("[%s] %s (%d occurrences)\n", levelStr, t.Pattern, t.Count))
+	fmt.Fprintf(&sb, "[%s] %s (%d occurrences)\n", levelStr, t.Pattern, t.Count)
 
 	// Examples (if space permits and we have them)
 	if len(t.Examples) > 0 {
@@ -378,7 +398,7 @@ func (c *Compressor) formatTemplate(t TemplateSummary) string {
 			if len(ex) > 120 {
 				ex = ex[:117] + "..."
 			}
-			sb.WriteString(fmt.Sprintf("    - %s\n", ex))
+			fmt.Fprintf(&sb, "    - %s\n", ex)
 		}
 	}
 
@@ -390,7 +410,7 @@ func (c *Compressor) writeFooter(sb *strings.Builder, output *CompressedOutput)
 	output.Metadata["included_templates"] = len(output.Templates)
 	output.Metadata["compression_ratio"] = float64(output.TotalLines) / float64(len(output.Templates)+1)
 
-	sb.WriteString(fmt.Sprintf("Token Count: ~%d / %d\n", output.TokenCount, output.TokenLimit))
+	fmt.Fprintf(sb, "Token Count: ~%d / %d\n", output.TokenCount, output.TokenLimit)
 }
 
 // estimateTokens provides a rough estimate of token count.
@@ -1,8 +1,9 @@
 package preprocess
 
 import (
-	"fmt"
 	"regexp"
+	"sort"
+	"strconv"
 	"strings"
 	"sync"
 )
@@ -27,7 +28,6 @@ type DrainExtractor struct {
 	simThreshold float64
 	maxChildren  int
 	templates    map[string]*Template // Template ID -> Template
-	tokenRegex   *regexp.Regexp       // For tokenizing messages
 	mu           sync.RWMutex
 }
 
@@ -39,6 +39,16 @@ type ParseTreeNode struct {
 	templateIDs []string                  // For leaf nodes - can have multiple templates
 }
 
+// setChild adds child under token, allocating the children map on first use.
+// Only inner nodes get children and only leaves get template IDs, so both are
+// left nil until needed rather than allocated for every node.
+func (n *ParseTreeNode) setChild(token string, child *ParseTreeNode) {
+	if n.children == nil {
+		n.children = make(map[string]*ParseTreeNode)
+	}
+	n.children[token] = child
+}
+
 // NodeType represents the type of a parse tree node.
 type NodeType int
 
@@ -83,16 +93,11 @@ func NewDrainExtractor(depth int, simThreshold float64, maxChildren int) *DrainE
 	}
 
 	return &DrainExtractor{
-		root: &ParseTreeNode{
-			nodeType:    RootNode,
-			children:    make(map[string]*ParseTreeNode),
-			templateIDs: []string{},
-		},
+		root:         &ParseTreeNode{nodeType: RootNode},
 		depth:        depth,
 		simThreshold: simThreshold,
 		maxChildren:  maxChildren,
 		templates:    make(map[string]*Template),
-		tokenRegex:   regexp.MustCompile(`[^\s]+`), // Split by whitespace
 	}
 }
 
@@ -142,13 +147,9 @@ func (d *DrainExtractor) findOrCreateTemplate(tokens []string) string {
 	currentNode := d.root
 
 	// Level 1: Length node - group by token count
-	lengthKey := fmt.Sprintf("len_%d", len(tokens))
+	lengthKey := "len_" + strconv.Itoa(len(tokens))
 	if _, ok := currentNode.children[lengthKey]; !ok {
-		currentNode.children[lengthKey] = &ParseTreeNode{
-			nodeType:    LengthNode,
-			children:    make(map[string]*ParseTreeNode),
-			templateIDs: []string{},
-		}
+		currentNode.setChild(lengthKey, &ParseTreeNode{nodeType: LengthNode})
 	}
 	currentNode = currentNode.children[lengthKey]
 
@@ -167,19 +168,10 @@ func (d *DrainExtractor) findOrCreateTemplate(tokens []string) string {
 				// Too many children, use wildcard
 				token = "<*>"
 				if _, ok := currentNode.children[token]; !ok {
-					currentNode.children[token] = &ParseTreeNode{
-						nodeType:    WildcardNode,
-						children:    make(map[string]*ParseTreeNode),
-						templateIDs: []string{},
-					}
+					currentNode.setChild(token, &ParseTreeNode{nodeType: WildcardNode})
 				}
 			} else {
-				currentNode.children[token] = &ParseTreeNode{
-					nodeType:    TokenNode,
-					token:       token,
-					children:    make(map[string]*ParseTreeNode),
-					templateIDs: []string{},
-				}
+				currentNode.setChild(token, &ParseTreeNode{nodeType: TokenNode, token: token})
 			}
 		}
 		currentNode = currentNode.children[token]
@@ -216,28 +208,24 @@ func (d *DrainExtractor) findOrCreateTemplate(tokens []string) string {
 	return templateID
 }
 
+// variableTokenPattern matches tokens that are likely variable fields:
+// numbers (integers, decimals, hex), IPv4 addresses, UUIDs, and ISO 8601
+// timestamps. The alternatives are combined so each token is scanned once.
+// The timestamp alternative is a prefix match; the others must match the
+// whole token.
+var variableTokenPattern = regexp.MustCompile(
+	`^(?:` +
+		`-?\d+(?:\.\d+)?$` + // Numbers
+		`|0[xX][0-9a-fA-F]+$` + // Hex
+		`|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$` + // IP addresses
+		`|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$` + // UUIDs
+		`|\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}` + // Timestamps (ISO 8601 like)
+		`)`,
+)
+
 // isVariableToken checks if a token is likely a variable field (number, ID, etc.)
 func (d *DrainExtractor) isVariableToken(token string) bool {
-	// Numbers (integers, decimals, hex)
-	if regexp.MustCompile(`^-?\d+(\.\d+)?$`).MatchString(token) {
-		return true
-	}
-	if regexp.MustCompile(`^0[xX][0-9a-fA-F]+$`).MatchString(token) {
-		return true
-	}
-
-	// IP addresses
-	if regexp.MustCompile(`^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$`).MatchString(token) {
-		return true
-	}
-
-	// UUIDs
-	if regexp.MustCompile(`^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$`).MatchString(token) {
-		return true
-	}
-
-	// Timestamps (ISO 8601 like)
-	if regexp.MustCompile(`^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}`).MatchString(token) {
+	if variableTokenPattern.MatchString(token) {
 		return true
 	}
 
@@ -249,9 +237,9 @@ func (d *DrainExtractor) isVariableToken(token string) bool {
 	return false
 }
 
-// tokenize splits a message into tokens.
+// tokenize splits a message into whitespace-separated tokens.
 func (d *DrainExtractor) tokenize(message string) []string {
-	return d.tokenRegex.FindAllString(message, -1)
+	return strings.Fields(message)
 }
 
 // calculateSimilarity computes the Jaccard-like similarity between two token sequences.
@@ -333,7 +321,7 @@ func (d *DrainExtractor) tokensToPattern(tokens []string) string {
 
 // generateTemplateID creates a unique template ID.
 func (d *DrainExtractor) generateTemplateID() string {
-	return fmt.Sprintf("T_%d", len(d.templates)+1)
+	return "T_" + strconv.Itoa(len(d.templates)+1)
 }
 
 // GetTemplates returns all extracted templates sorted by frequency (descending).
@@ -347,13 +335,9 @@ func (d *DrainExtractor) GetTemplates() []*Template {
 	}
 
 	// Sort by count descending
-	for i := 0; i < len(templates)-1; i++ {
-		for j := i + 1; j < len(templates); j++ {
-			if templates[j].Count > templates[i].Count {
-				templates[i], templates[j] = templates[j], templates[i]
-			}
-		}
-	}
+	sort.SliceStable(templates, func(i, j int) bool {
+		return templates[i].Count > templates[j].Count
+	})
 
 	return templates
 }
@@ -382,11 +366,7 @@ func (d *DrainExtractor) Reset() {
 	d.mu.Lock()
 	defer d.mu.Unlock()
 
-	d.root = &ParseTreeNode{
-		nodeType:    RootNode,
-		children:    make(map[string]*ParseTreeNode),
-		templateIDs: []string{},
-	}
+	d.root = &ParseTreeNode{nodeType: RootNode}
 	d.templates = make(map[string]*Template)
 }
 
@@ -2,6 +2,7 @@ package preprocess
 
 import (
 	"fmt"
+	"strings"
 
 	"github.com/bimmerbailey/cyro/internal/config"
 )
@@ -94,7 +95,6 @@ func New(opts ...Option) *Preprocessor {
 	p := &Preprocessor{
 		redactor:   NewRedactor(true, DefaultPatterns()),
 		drain:      NewDrainExtractor(0, 0, 0), // Uses defaults
-		compressor: NewCompressor(DefaultTokenLimit),
 		tokenLimit: DefaultTokenLimit,
 		debug:      false,
 	}
@@ -104,7 +104,7 @@ func New(opts ...Option) *Preprocessor {
 		opt(p)
 	}
 
-	// Re-create compressor with correct token limit
+	// Create compressor once the token limit is known
 	p.compressor = NewCompressor(p.tokenLimit)
 
 	return p
@@ -237,13 +237,8 @@ func (p *Preprocessor) countRedactedTypes(redactedValues map[string]string) map[
 	for _, placeholder := range redactedValues {
 		// Extract type from placeholder [TYPE:hash]
 		if len(placeholder) > 2 {
-			// Find the first colon
-			for i := 1; i < len(placeholder)-1; i++ {
-				if placeholder[i] == ':' {
-					typ := placeholder[1:i]
-					counts[typ]++
-					break
-				}
+			if i := strings.IndexByte(placeholder[1:len(placeholder)-1], ':'); i >= 0 {
+				counts[placeholder[1:i+1]]++
 			}
 		}
 	}
@@ -172,10 +172,13 @@ func (r *Redactor) RedactAndCount(text string) (string, int) {
 	count := 0
 	result := text
 
+	// Count inside the replacement callback so each pattern scans the text once.
 	for _, pattern := range r.patterns {
-		matches := pattern.Regex.FindAllString(result, -1)
-		count += len(matches)
-		result = r.redactPattern(result, pattern)
+		patternType := pattern.Type
+		result = pattern.Regex.ReplaceAllStringFunc(result, func(match string) string {
+			count++
+			return r.getPlaceholder(match, patternType)
+		})
 	}
 
 	return result, count
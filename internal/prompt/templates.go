@@ -129,14 +129,14 @@ func buildStructuredOutput(opts BuildOptions) ([]llm.Message, error) {
 // (time range, file list) into sb.
 func appendLogContext(sb *strings.Builder, opts BuildOptions) {
 	if opts.TimeRange != "" {
-		sb.WriteString(fmt.Sprintf("Time range: %s\n\n", opts.TimeRange))
+		fmt.Fprintf(sb, "Time range: %s\n\n", opts.TimeRange)
 	}
 
 	if len(opts.Files) == 1 {
-		sb.WriteString(fmt.Sprintf("Source file: %s\n\n", opts.Files[0]))
+		fmt.Fprintf(sb, "Source file: %s\n\n", opts.Files[0])
 	} else if len(opts.Files) > 1 {
-		sb.WriteString(fmt.Sprintf("Source files (%d): %s\n\n",
-			len(opts.Files), strings.Join(opts.Files, ", ")))
+		fmt.Fprintf(sb, "Source files (%d): %s\n\n",
+			len(opts.Files), strings.Join(opts.Files, ", "))
 	}
 
 	sb.WriteString(opts.Summary)
@@ -146,24 +146,27 @@ func appendLogContext(sb *strings.Builder, opts BuildOptions) {
 // appendFilterNotes appends human-readable notes about any filters that were
 // applied before compression, so the model knows the data was pre-filtered.
 func appendFilterNotes(sb *strings.Builder, opts BuildOptions) {
-	var notes []string
-
-	if opts.Pattern != "" {
-		notes = append(notes, fmt.Sprintf("Filtered by pattern: %s", opts.Pattern))
-	}
-	if opts.Level != "" {
-		notes = append(notes, fmt.Sprintf("Filtered by level: %s", opts.Level))
-	}
-	if opts.GroupBy != "" {
-		notes = append(notes, fmt.Sprintf("Analysis grouped by: %s", opts.GroupBy))
-	}
-	if opts.Window != "" {
-		notes = append(notes, fmt.Sprintf("Time window applied: %s", opts.Window))
+	wrote := false
+	note := func(label, value string) {
+		if value == "" {
+			return
+		}
+		if wrote {
+			sb.WriteString("; ")
+		} else {
+			sb.WriteString("Note: ")
+		}
+		sb.WriteString(label)
+		sb.WriteString(value)
+		wrote = true
 	}
 
-	if len(notes) > 0 {
-		sb.WriteString("Note: ")
-		sb.WriteString(strings.Join(notes, "; "))
+	note("Filtered by pattern: ", opts.Pattern)
+	note("Filtered by level: ", opts.Level)
+	note("Analysis grouped by: ", opts.GroupBy)
+	note("Time window applied: ", opts.Window)
+
+	if wrote {
 		sb.WriteString(".\n")
 	}
 }
@@ -6,12 +6,13 @@ package tail
 
 import (
 	"bufio"
+	"bytes"
 	"context"
+	"errors"
 	"fmt"
 	"io"
 	"os"
 	"regexp"
-	"strings"
 	"time"
 
 	"github.com/bimmerbailey/cyro/internal/config"
@@ -19,15 +20,28 @@ import (
 	"github.com/fsnotify/fsnotify"
 )
 
+// ErrFileRotated is returned by Run when the file is rotated and
+// FollowRotate is not set.
+var ErrFileRotated = errors.New("file rotated")
+
+// ErrRotateTimeout is returned by Run when FollowRotate is set and the file
+// does not reappear within RotateTimeout.
+var ErrRotateTimeout = errors.New("timeout waiting for rotated file to reappear")
+
+// DefaultRotateTimeout is how long the tailer waits for a rotated file to
+// reappear when Options.RotateTimeout is not set.
+const DefaultRotateTimeout = 10 * time.Second
+
 // Options configures the tailer behavior.
 type Options struct {
-	FilePath     string                      // Path to the log file
-	Lines        int                         // Number of initial lines to show
-	Follow       bool                        // Whether to follow the file for new content
-	FollowRotate bool                        // Whether to follow through log rotations
-	Pattern      *regexp.Regexp              // Optional regex pattern to filter lines
-	LevelFilter  config.LogLevel             // Minimum log level to display
-	OutputFunc   func(config.LogEntry) error // Function called for each matching entry
+	FilePath      string                      // Path to the log file
+	Lines         int                         // Number of initial lines to show
+	Follow        bool                        // Whether to follow the file for new content
+	FollowRotate  bool                        // Whether to follow through log rotations
+	RotateTimeout time.Duration               // How long to wait for a rotated file (default DefaultRotateTimeout)
+	Pattern       *regexp.Regexp              // Optional regex pattern to filter lines
+	LevelFilter   config.LogLevel             // Minimum log level to display
+	OutputFunc    func(config.LogEntry) error // Function called for each matching entry
 }
 
 // Tailer handles tailing a log file with filtering.
@@ -35,10 +49,15 @@ type Tailer struct {
 	opts    Options
 	parser  *parser.Parser
 	file    *os.File
+	size    int64 // File size observed when the file was opened
 	offset  int64
 	watcher *fsnotify.Watcher
+	buf     []byte // Scanner buffer reused across reads
 }
 
+// maxScanTokenSize is the longest line the tailer accepts.
+const maxScanTokenSize = 1024 * 1024 // 1MB
+
 // New creates a new Tailer with the given options.
 func New(opts Options) *Tailer {
 	return &Tailer{
@@ -85,14 +104,17 @@ func (t *Tailer) openFile() error {
 	}
 	t.file = f
 
+	// Stat once here; readInitialLines reuses the size
+	stat, err := f.Stat()
+	if err != nil {
+		return err
+	}
+	t.size = stat.Size()
+
 	// Get initial file position at the end
 	if t.opts.Follow {
 		// We'll seek back for initial lines, then return to end
-		stat, err := f.Stat()
-		if err != nil {
-			return err
-		}
-		t.offset = stat.Size()
+		t.offset = t.size
 	}
 
 	return nil
@@ -100,12 +122,7 @@ func (t *Tailer) openFile() error {
 
 // readInitialLines reads and displays the last N lines from the file.
 func (t *Tailer) readInitialLines() error {
-	// Get file size
-	stat, err := t.file.Stat()
-	if err != nil {
-		return err
-	}
-	fileSize := stat.Size()
+	fileSize := t.size
 
 	// If file is empty, nothing to read
 	if fileSize == 0 {
@@ -128,9 +145,7 @@ func (t *Tailer) readInitialLines() error {
 
 	// Create scanner
 	scanner := bufio.NewScanner(t.file)
-	const maxScanTokenSize = 1024 * 1024 // 1MB
-	buf := make([]byte, maxScanTokenSize)
-	scanner.Buffer(buf, maxScanTokenSize)
+	scanner.Buffer(t.scanBuffer(), maxScanTokenSize)
 
 	// If we're not at the start, skip the first partial line
 	if startPos > 0 {
@@ -139,22 +154,34 @@ func (t *Tailer) readInitialLines() error {
 		}
 	}
 
-	// Read all lines from this position to end
-	var entries []config.LogEntry
+	// Read all lines from this position to end, keeping only the last N
+	// matching entries in a ring buffer
+	keep := t.opts.Lines
+	if keep < 0 {
+		keep = 0
+	}
+	entries := make([]config.LogEntry, 0, keep)
+	oldest := 0 // Index of the oldest entry once the buffer is full
 	linesRead := 0
 	for scanner.Scan() {
 		linesRead++
-		line := scanner.Text()
 
-		// Skip empty lines
-		if strings.TrimSpace(line) == "" {
+		// Skip empty lines before allocating a string for them
+		if len(bytes.TrimSpace(scanner.Bytes())) == 0 {
 			continue
 		}
+		line := scanner.Text()
 
-		entry := t.parseLine(line, linesRead)
+		entry := t.parser.ParseLine(line, linesRead)
 
-		if t.shouldDisplay(entry) {
+		if keep == 0 || !t.shouldDisplay(entry) {
+			continue
+		}
+		if len(entries) < keep {
 			entries = append(entries, entry)
+		} else {
+			entries[oldest] = entry
+			oldest = (oldest + 1) % keep
 		}
 	}
 
@@ -162,19 +189,15 @@ func (t *Tailer) readInitialLines() error {
 		return err
 	}
 
-	// Keep only the last N entries
-	if len(entries) > t.opts.Lines {
-		entries = entries[len(entries)-t.opts.Lines:]
-	}
-
-	// Output the entries
-	for _, entry := range entries {
-		if err := t.opts.OutputFunc(entry); err != nil {
+	// Output the entries, oldest first
+	for i := range entries {
+		if err := t.opts.OutputFunc(entries[(oldest+i)%len(entries)]); err != nil {
 			return err
 		}
 	}
 
 	// Update offset to current position (end of file)
+	var err error
 	t.offset, err = t.file.Seek(0, io.SeekEnd)
 	return err
 }
@@ -239,6 +262,16 @@ func (t *Tailer) handleEvent(ctx context.Context, event fsnotify.Event) error {
 	return nil
 }
 
+// scanBuffer returns the Tailer's scanner buffer, allocating it on first use.
+// readNewContent runs on every write event, so reusing one buffer avoids a
+// 1MB allocation per event.
+func (t *Tailer) scanBuffer() []byte {
+	if t.buf == nil {
+		t.buf = make([]byte, maxScanTokenSize)
+	}
+	return t.buf
+}
+
 // readNewContent reads and outputs new content added to the file.
 func (t *Tailer) readNewContent() error {
 	// Seek to last known position
@@ -248,21 +281,19 @@ func (t *Tailer) readNewContent() error {
 
 	// Read new lines
 	scanner := bufio.NewScanner(t.file)
-	const maxScanTokenSize = 1024 * 1024 // 1MB
-	buf := make([]byte, maxScanTokenSize)
-	scanner.Buffer(buf, maxScanTokenSize)
+	scanner.Buffer(t.scanBuffer(), maxScanTokenSize)
 
 	lineNum := 0
 	for scanner.Scan() {
 		lineNum++
-		line := scanner.Text()
 
-		// Skip empty lines
-		if strings.TrimSpace(line) == "" {
+		// Skip empty lines before allocating a string for them
+		if len(bytes.TrimSpace(scanner.Bytes())) == 0 {
 			continue
 		}
+		line := scanner.Text()
 
-		entry := t.parseLine(line, lineNum)
+		entry := t.parser.ParseLine(line, lineNum)
 
 		if t.shouldDisplay(entry) {
 			if err := t.opts.OutputFunc(entry); err != nil {
@@ -286,7 +317,7 @@ func (t *Tailer) handleRotation(ctx context.Context) error {
 	if !t.opts.FollowRotate {
 		// Exit gracefully
 		fmt.Fprintf(os.Stderr, "\nFile rotated. Exiting. Use --follow-rotate to follow through rotations.\n")
-		return fmt.Errorf("file rotated")
+		return ErrFileRotated
 	}
 
 	// Close current file
@@ -296,7 +327,11 @@ func (t *Tailer) handleRotation(ctx context.Context) error {
 	}
 
 	// Wait for new file to appear (with timeout)
-	timeout := time.After(10 * time.Second)
+	rotateTimeout := t.opts.RotateTimeout
+	if rotateTimeout <= 0 {
+		rotateTimeout = DefaultRotateTimeout
+	}
+	timeout := time.After(rotateTimeout)
 	ticker := time.NewTicker(100 * time.Millisecond)
 	defer ticker.Stop()
 
@@ -305,7 +340,7 @@ func (t *Tailer) handleRotation(ctx context.Context) error {
 		case <-ctx.Done():
 			return nil
 		case <-timeout:
-			return fmt.Errorf("timeout waiting for rotated file to reappear")
+			return fmt.Errorf("%w after %s", ErrRotateTimeout, rotateTimeout)
 		case <-ticker.C:
 			// Try to open the file
 			f, err := os.Open(t.opts.FilePath)
@@ -326,31 +361,6 @@ func (t *Tailer) handleRotation(ctx context.Context) error {
 	}
 }
 
-// parseLine parses a single log line into a LogEntry.
-func (t *Tailer) parseLine(line string, lineNum int) config.LogEntry {
-	entry := config.LogEntry{
-		Raw:    line,
-		Line:   lineNum,
-		Level:  config.LevelUnknown,
-		Fields: make(map[string]interface{}),
-	}
-
-	// Use parser's internal logic by creating a temporary reader with newline
-	// The parser expects complete lines ending with newline
-	lineWithNewline := line + "\n"
-
-	// Create a minimal parser instance and parse the line
-	p := parser.New(nil)
-	entries, err := p.Parse(strings.NewReader(lineWithNewline))
-	if err == nil && len(entries) > 0 {
-		entry = entries[0]
-		entry.Line = lineNum // Preserve our line number
-		entry.Raw = line     // Use original line without newline
-	}
-
-	return entry
-}
-
 // shouldDisplay checks if an entry matches the filter criteria.
 func (t *Tailer) shouldDisplay(entry config.LogEntry) bool {
 	// Check level filter
@@ -377,21 +387,13 @@ func (t *Tailer) shouldDisplay(entry config.LogEntry) bool {
 }
 
 // levelToInt converts a log level to an integer for comparison.
+// Known levels are ordered Debug (0) through Fatal (4), matching their
+// config.LogLevel values; anything else maps to -1 so it is always shown.
 func levelToInt(level config.LogLevel) int {
-	switch level {
-	case config.LevelDebug:
-		return 0
-	case config.LevelInfo:
-		return 1
-	case config.LevelWarn:
-		return 2
-	case config.LevelError:
-		return 3
-	case config.LevelFatal:
-		return 4
-	default:
+	if level < config.LevelDebug || level > config.LevelFatal {
 		return -1 // Unknown levels are shown
 	}
+	return int(level)
 }
 
 // close closes all resources.
@@ -2,6 +2,7 @@ package tail
 
 import (
 	"context"
+	"errors"
 	"os"
 	"path/filepath"
 	"regexp"
@@ -419,6 +420,27 @@ func TestTailer_NoFollowMode(t *testing.T) {
 	}
 }
 
+func TestTailer_RotateTimeout(t *testing.T) {
+	filePath := filepath.Join(t.TempDir(), "rotated.log")
+
+	tailer := New(Options{
+		FilePath:      filePath,
+		FollowRotate:  true,
+		RotateTimeout: 50 * time.Millisecond,
+	})
+
+	start := time.Now()
+	err := tailer.handleRotation(context.Background())
+	if !errors.Is(err, ErrRotateTimeout) {
+		t.Fatalf("handleRotation() error = %v, want ErrRotateTimeout", err)
+	}
+
+	// Should honor the configured timeout rather than the default
+	if duration := time.Since(start); duration > DefaultRotateTimeout/2 {
+		t.Errorf("handleRotation() took %v, expected about %v", duration, 50*time.Millisecond)
+	}
+}
+
 func TestTailer_MultipleLogFormats(t *testing.T) {
 	tests := []struct {
 		name    string
@@ -648,16 +670,14 @@ func TestTailer_LargeFile(t *testing.T) {
 	tmpDir := t.TempDir()
 	filePath := filepath.Join(tmpDir, "large.log")
 
-	f, err := os.Create(filePath)
-	if err != nil {
-		t.Fatalf("Failed to create file: %v", err)
-	}
-
 	// Write 1000 lines
+	var content strings.Builder
 	for i := 1; i <= 1000; i++ {
-		f.WriteString("This is log line number " + string(rune(i)) + " with some content to make it longer\n")
+		content.WriteString("This is log line number " + string(rune(i)) + " with some content to make it longer\n")
+	}
+	if err := os.WriteFile(filePath, []byte(content.String()), 0644); err != nil {
+		t.Fatalf("Failed to create file: %v", err)
 	}
-	f.Close()
 
 	outputFunc, entries := countingOutputFunc(t)
 	tailer := New(Options{